@@ -0,0 +1,73 @@
+"""
+Single-Producer / Single-Consumer ring buffer
+
+Lock-free channel for the send_message -> background reflection path.
+queue.Queue takes a Lock plus a Condition on every put/get; for a
+strict SPSC pairing that overhead is avoidable: head is only advanced
+by the consumer, tail only by the producer, and int loads/stores are
+atomic under the GIL. A threading.Event is used solely to park the
+consumer when the ring is empty.
+"""
+
+import logging
+import threading
+from queue import Empty
+
+logger = logging.getLogger(__name__)
+
+# Dedicated shutdown marker for ring consumers. None must never be an
+# in-band message: it is also the empty-slot filler inside the ring.
+SHUTDOWN = object()
+
+
+class SPSCRing:
+    """Fixed-capacity single-producer / single-consumer ring buffer"""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._buffer = [None] * capacity
+        self._head = 0  # next slot to read (advanced by consumer only)
+        self._tail = 0  # next slot to write (advanced by producer only)
+        self._not_empty = threading.Event()
+
+    def put(self, item) -> bool:
+        """Non-blocking put; drops the incoming item if the ring is full.
+
+        Never blocks the producer, so the request path is decoupled from
+        a slow consumer. Overflow drops the new item (logged) and returns
+        False: head is consumer-owned, so the producer must not advance
+        it to evict the oldest — that would race a concurrent get on the
+        same slot.
+        """
+        if self._tail - self._head >= self.capacity:
+            logger.warning("SPSCRing full, dropping incoming item")
+            return False
+        self._buffer[self._tail % self.capacity] = item
+        self._tail += 1
+        self._not_empty.set()
+        return True
+
+    def get(self, timeout: float = None):
+        """Pop the oldest item
+
+        Waits on the wake-up Event when empty; raises queue.Empty if
+        nothing arrives within timeout (mirrors queue.Queue.get).
+        """
+        if self._head >= self._tail:
+            self._not_empty.clear()
+            # Re-check after clear so a put() racing the clear is not lost
+            if self._head >= self._tail:
+                self._not_empty.wait(timeout)
+                if self._head >= self._tail:
+                    raise Empty
+        idx = self._head % self.capacity
+        item = self._buffer[idx]
+        self._buffer[idx] = None
+        self._head += 1
+        return item
+
+    def qsize(self) -> int:
+        return max(0, self._tail - self._head)
+
+    def empty(self) -> bool:
+        return self._head >= self._tail
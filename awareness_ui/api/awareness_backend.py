@@ -9,18 +9,66 @@ Simplified system:
 - User free-text feedback (processed in dream mode)
 """
 
+import atexit
 import json
 import logging
+import sys
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
 from .lm_studio import LMStudioAPI
+from ._spsc import SPSCRing, SHUTDOWN
 
 logger = logging.getLogger(__name__)
 
+# The six personality axes (see engines.personality_axis.PERSONALITY_AXES),
+# with their ChromaDB metadata keys precomputed once
+AXIS_KEYS = (
+    "analysis_overview",
+    "individual_collective",
+    "empathy_responsibility",
+    "cooperation_independence",
+    "stability_transformation",
+    "divergence_convergence",
+)
+INPUT_AXIS_KEYS = tuple((k, "input_" + k) for k in AXIS_KEYS)
+RESPONSE_AXIS_KEYS = tuple((k, "response_" + k) for k in AXIS_KEYS)
+
+# History role enum -> prompt label (0 = user, 1 = assistant)
+ROLE_LABELS = ("User", "Assistant")
+
+
+def _ensure_engines_path():
+    """Make the repo root importable for the engines package (once)
+
+    sys.path.append is O(1) and idempotent here, unlike the repeated
+    sys.path.insert(0, ...) the lazy properties used to do.
+    """
+    root = str(Path(__file__).parent.parent.parent)
+    if root not in sys.path:
+        sys.path.append(root)
+
+
+def count_jsonl_lines(path: Path) -> int:
+    """Count lines of a JSONL file
+
+    Reads in large binary chunks and counts raw newlines, avoiding
+    per-line UTF-8 decode and the default 8KB buffer.
+    """
+    if not path.exists():
+        return 0
+    n = 0
+    with open(path, "rb", buffering=1 << 20) as f:
+        while chunk := f.read(1 << 20):
+            n += chunk.count(b"\n")
+    return n
+
 
 class AwarenessBackend:
     """Main backend coordinator for Awareness UI"""
@@ -45,26 +93,61 @@ class AwarenessBackend:
         self._dreaming = None
         self._personality = None
 
-        # Conversation state
-        self.conversation_history = []
+        # Conversation state, SoA layout: parallel role/content deques
+        # (no per-turn dict allocation; deques trim themselves)
+        self.history_roles = deque(maxlen=20)  # 0 = user, 1 = assistant
+        self.history_contents = deque(maxlen=20)
         self.current_analysis = None  # Current turn's 6-axis analysis
         self.current_reflection = None  # Current turn's reflection (insight only)
+        self._reflection_seq = 0  # Bumped whenever a reflection completes
+        self._reflection_ready = threading.Event()  # Set alongside the bump
         self.last_user_input = ""
         self.last_assistant_output = ""
 
-        # Background processing
-        self.reflection_queue = queue.Queue()
+        # Background processing (lock-free SPSC: send_message -> processor)
+        self.reflection_queue = SPSCRing(capacity=256)
         self._start_background_processor()
 
+        # Batched ChromaDB writes: producers (send_message, the reflection
+        # processor) only append to the buffer; a dedicated writer thread
+        # owns every ChromaDB insert
+        self._pending_saves: list[dict] = []
+        self._pending_lock = threading.Lock()
+        self._save_batch_size = 64
+        self._save_flush_interval = 0.5
+        self._flush_event = threading.Event()
+        self._shutdown = False
+        self._start_writer_thread()
+        atexit.register(self.close)
+
         # User feedback file
         self.user_feedback_file = self.data_dir / "user_feedback.jsonl"
 
+        # Storage info cache (dashboards poll every few seconds)
+        self._storage_info_cache: Optional[dict] = None
+        self._storage_info_time = 0.0
+
+        # Assembled-context cache for build_system_prompt, keyed on
+        # (user_input, memory version); the version bumps on every queued save
+        self._memory_version = 0
+        self._context_cache: dict = {}
+
+        # Persistent pool for the independent context lookups
+        self._ctx_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ctx")
+
+        # Dream-insight cache; insights.jsonl only changes when a dream
+        # runs (here or in the Moltbook agent), so key on its mtime
+        self._dream_insights_cache: Optional[list] = None
+        self._dream_insights_mtime = -1.0
+
+        # Formatted axis prompts, keyed on the (small, discrete) axis values
+        self._axes_prompt_cache: dict = {}
+
     @property
     def memory(self):
         """Lazy load memory system"""
         if self._memory is None:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+            _ensure_engines_path()
             from engines.memory_system import MemorySystem
             self._memory = MemorySystem(data_dir=str(self.data_dir / "chromadb"))
         return self._memory
@@ -73,8 +156,7 @@ class AwarenessBackend:
     def dreaming(self):
         """Lazy load dreaming engine with both memory sources"""
         if self._dreaming is None:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+            _ensure_engines_path()
             from engines.dreaming_engine import DreamingEngine
             from engines.integrated_agent import SimpleMemory
 
@@ -99,8 +181,7 @@ class AwarenessBackend:
     def personality(self):
         """Lazy load personality axis engine"""
         if self._personality is None:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+            _ensure_engines_path()
             from engines.personality_axis import PersonalityAxisEngine
             lm_config = self.config.get("lm_studio", {})
             self._personality = PersonalityAxisEngine(
@@ -117,7 +198,7 @@ class AwarenessBackend:
             while True:
                 try:
                     task = self.reflection_queue.get(timeout=1)
-                    if task is None:
+                    if task is SHUTDOWN:
                         break
 
                     user_input, assistant_output, input_axes, response_axes = task
@@ -130,35 +211,39 @@ class AwarenessBackend:
                         response_axes=response_axes
                     )
                     self.current_reflection = result
+                    self._reflection_seq += 1
+                    self._reflection_ready.set()
 
                     if result and result.get("insight"):
                         insight = result.get("insight", "")
-                        logger.info(f"Reflection insight: {insight[:100]}...")
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Reflection insight: %s...", insight[:100])
 
                         # Save insight to ChromaDB (flatten axes for ChromaDB compatibility)
                         metadata = {
                             "source": "reflection",
                             "trigger": user_input[:100]
                         }
-                        # Flatten input_axes
+                        # Flatten axes with the precomputed metadata keys
                         if input_axes:
-                            for k, v in input_axes.items():
-                                metadata[f"input_{k}"] = v
-                        # Flatten response_axes
+                            metadata.update(
+                                (mk, input_axes[k]) for k, mk in INPUT_AXIS_KEYS if k in input_axes
+                            )
                         if response_axes:
-                            for k, v in response_axes.items():
-                                metadata[f"response_{k}"] = v
+                            metadata.update(
+                                (mk, response_axes[k]) for k, mk in RESPONSE_AXIS_KEYS if k in response_axes
+                            )
 
-                        self.memory.save(
+                        self._queue_save(
                             content=f"[Insight] {insight}",
                             category="insight",
                             importance=7,
                             user_id="global",
                             metadata=metadata
                         )
-                        logger.info("ChromaDB auto-save: Reflection insight")
+                        logger.info("ChromaDB auto-save queued: Reflection insight")
 
-                    logger.info(f"Background reflection complete")
+                    logger.info("Background reflection complete")
 
                 except queue.Empty:
                     continue
@@ -168,6 +253,79 @@ class AwarenessBackend:
         self._processor_thread = threading.Thread(target=process_loop, daemon=True)
         self._processor_thread.start()
 
+    def _start_writer_thread(self):
+        """Start the writer thread that owns all batched ChromaDB inserts"""
+        def writer_loop():
+            while not self._shutdown:
+                # Wake early when the batch-size trigger fires
+                self._flush_event.wait(self._save_flush_interval)
+                self._flush_event.clear()
+                self.flush()
+            self.flush()
+
+        self._writer_thread = threading.Thread(target=writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def _queue_save(
+        self,
+        content: str,
+        category: str = "general",
+        importance: int = 5,
+        user_id: str = "global",
+        metadata: Optional[dict] = None
+    ):
+        """Queue a memory save for batched ChromaDB insertion"""
+        with self._pending_lock:
+            self._pending_saves.append({
+                "content": content,
+                "category": category,
+                "importance": importance,
+                "user_id": user_id,
+                "metadata": metadata,
+            })
+            self._memory_version += 1
+            should_flush = len(self._pending_saves) >= self._save_batch_size
+        if should_flush:
+            # Hand the flush to the timer thread; callers (send_message,
+            # the reflection processor) never block on a ChromaDB insert
+            self._flush_event.set()
+
+    def flush(self):
+        """Flush pending memory saves to ChromaDB in one batch"""
+        with self._pending_lock:
+            pending = self._pending_saves
+            self._pending_saves = []
+
+        if not pending:
+            return
+
+        try:
+            self.memory.save_batch(
+                contents=[p["content"] for p in pending],
+                categories=[p["category"] for p in pending],
+                importances=[p["importance"] for p in pending],
+                user_ids=[p["user_id"] for p in pending],
+                metadatas=[p["metadata"] for p in pending]
+            )
+            logger.info(f"Flushed {len(pending)} memory saves to ChromaDB")
+        except Exception as e:
+            logger.error(f"Batch save failed: {e}")
+
+    def close(self):
+        """Stop the background threads and flush remaining writes"""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._flush_event.set()
+        # Best-effort: give a busy consumer a moment to drain so the
+        # shutdown marker isn't dropped on a full ring
+        for _ in range(100):
+            if self.reflection_queue.put(SHUTDOWN):
+                break
+            time.sleep(0.01)
+        self._writer_thread.join(timeout=5)
+        self.flush()
+
     def check_connection(self) -> dict:
         """Check LM Studio connection"""
         return self.lm_api.check_connection()
@@ -180,38 +338,62 @@ class AwarenessBackend:
         """Build system prompt with injected context"""
         base_prompt = self.config.get("system_prompt", "")
 
-        # 1. Search related memories from ChromaDB
-        memory_context = ""
-        if user_input:
-            try:
-                memories = self.memory.search(user_input, user_id="global", limit=3)
-                if memories:
-                    memory_context = "\n\n## Related Memories:\n"
-                    for m in memories:
-                        memory_context += f"- {m.get('content', '')}\n"
-                    logger.info(f"Injecting {len(memories)} related memories")
-            except Exception as e:
-                logger.warning(f"Memory search failed: {e}")
+        # Reuse the assembled context (steps 1-3) while memory is unchanged;
+        # the personality slot (step 4) depends on current_analysis and is
+        # appended outside the cache
+        cache_key = (user_input, self._memory_version)
+        cached_context = self._context_cache.get(cache_key)
+        if cached_context is not None:
+            return base_prompt + cached_context + self._build_personality_context()
+
+        # The ChromaDB lookups share one multi-query round-trip; the dream
+        # insights load runs in parallel on the persistent pool
+        def chroma_lookups():
+            queries = [user_input] if user_input else []
+            categories = [None] if user_input else []
+            limits = [3] if user_input else []
+            queries.append("insight")
+            categories.append("insight")
+            limits.append(5)
+            results = self.memory.search_multi(
+                queries, user_id="global", limits=limits, categories=categories
+            )
+            if user_input:
+                return results[0], results[1]
+            return [], results[0]
 
-        # 2. Search recent insights from ChromaDB
-        insight_context = ""
+        chroma_future = self._ctx_pool.submit(chroma_lookups)
+        dream_future = self._ctx_pool.submit(self._get_dream_insights, limit=10)
+
+        memories, insights = [], []
         try:
-            insights = self.memory.search("insight", user_id="global", limit=5, category="insight")
-            if insights:
-                insight_context = "\n\n## Your Recent Insights:\n"
-                for i in insights:
-                    content = i.get('content', '')
-                    if '[Insight]' in content:
-                        content = content.replace('[Insight]', '').strip()
-                    insight_context += f"- {content}\n"
-                logger.info(f"Injecting {len(insights)} insights from ChromaDB")
+            memories, insights = chroma_future.result(timeout=2.0)
         except Exception as e:
-            logger.warning(f"Insight search failed: {e}")
+            logger.warning(f"Memory search failed: {e}")
+
+        # 1. Related memories from ChromaDB
+        memory_context = ""
+        if memories:
+            memory_context = "\n\n## Related Memories:\n"
+            for m in memories:
+                memory_context += f"- {m.get('content', '')}\n"
+            logger.info(f"Injecting {len(memories)} related memories")
+
+        # 2. Recent insights from ChromaDB
+        insight_context = ""
+        if insights:
+            insight_context = "\n\n## Your Recent Insights:\n"
+            for i in insights:
+                content = i.get('content', '')
+                if '[Insight]' in content:
+                    content = content.replace('[Insight]', '').strip()
+                insight_context += f"- {content}\n"
+            logger.info(f"Injecting {len(insights)} insights from ChromaDB")
 
         # 3. Load insights from dreaming engine
         dream_context = ""
         try:
-            dream_insights = self.dreaming.get_recent_insights(limit=10)
+            dream_insights = dream_future.result(timeout=2.0)
             if dream_insights:
                 dream_context = "\n\n## Past Insights (Dreaming):\n"
                 for entry in dream_insights:
@@ -220,55 +402,97 @@ class AwarenessBackend:
         except Exception as e:
             logger.warning(f"Dream insights load failed: {e}")
 
+        # Cache the assembled context (bounded, insertion-order eviction).
+        # Slowly-changing sections lead and the per-turn related memories
+        # come last, keeping the shared prompt prefix byte-identical across
+        # turns so LM Studio can reuse its KV cache for it
+        context = dream_context + insight_context + memory_context
+        if len(self._context_cache) >= 64:
+            self._context_cache.pop(next(iter(self._context_cache)))
+        self._context_cache[cache_key] = context
+
         # 4. Add personality axis guidance (if pre-analysis was done)
-        personality_context = ""
-        if self.current_analysis:
-            try:
-                response_axes = self.current_analysis.get("response_axes", {})
-                if response_axes:
-                    personality_context = "\n\n" + self.personality.format_axes_for_prompt(response_axes)
-                    logger.info(f"Injecting personality axis guidance")
-            except Exception as e:
-                logger.warning(f"Personality axis injection failed: {e}")
+        return base_prompt + context + self._build_personality_context()
 
-        # Combine all contexts
-        return base_prompt + memory_context + dream_context + insight_context + personality_context
+    def _get_dream_insights(self, limit: int = 10) -> list[dict]:
+        """Get recent dream insights, re-reading the file only when it changed"""
+        try:
+            mtime = self.dreaming.insights_file.stat().st_mtime
+        except OSError:
+            mtime = -1.0
 
-    def send_message(self, user_input: str) -> tuple[str, dict]:
-        """
-        Send message and get response
+        if self._dream_insights_cache is None or mtime != self._dream_insights_mtime:
+            self._dream_insights_cache = self.dreaming.get_recent_insights(limit=limit)
+            self._dream_insights_mtime = mtime
 
-        Returns:
-            tuple: (response_text, metadata)
+        return self._dream_insights_cache
+
+    def _build_personality_context(self) -> str:
+        """Format personality axis guidance from the current analysis"""
+        if not self.current_analysis:
+            return ""
+        try:
+            response_axes = self.current_analysis.get("response_axes", {})
+            if response_axes:
+                # Identical axis values format identically; cache the output
+                key = tuple(sorted(response_axes.items()))
+                cached = self._axes_prompt_cache.get(key)
+                if cached is None:
+                    cached = self.personality.format_axes_for_prompt(response_axes)
+                    if len(self._axes_prompt_cache) >= 256:
+                        self._axes_prompt_cache.pop(next(iter(self._axes_prompt_cache)))
+                    self._axes_prompt_cache[key] = cached
+                logger.info(f"Injecting personality axis guidance")
+                return "\n\n" + cached
+        except Exception as e:
+            logger.warning(f"Personality axis injection failed: {e}")
+        return ""
+
+    def _prepare_turn(self, user_input: str):
+        """Shared front half of a chat turn.
+
+        Kicks off the 6-axis pre-analysis and assembles the LM input;
+        returns (analysis_future, full_input, system_prompt).
         """
-        # Build context from history
+        # Build both history views in one pass: truncated context for
+        # pre-analysis, full content for the LM input
         context_parts = []
-        for msg in self.conversation_history[-6:]:  # Last 3 turns
-            role = "User" if msg["role"] == "user" else "Assistant"
-            context_parts.append(f"{role}: {msg['content'][:100]}...")
+        history_parts = []
+        recent_roles = list(self.history_roles)[-6:]  # Last 3 turns
+        recent_contents = list(self.history_contents)[-6:]
+        for r, content in zip(recent_roles, recent_contents):
+            role = ROLE_LABELS[r]
+            context_parts.append(f"{role}: {content[:100]}...")
+            history_parts.append(f"{role}: {content}")
         context = "\n".join(context_parts)
 
-        # === PRE-ANALYSIS: 6-axis analysis (BEFORE response generation) ===
-        self.current_analysis = None
+        # === PRE-ANALYSIS: 6-axis analysis, overlapped with the chat call ===
+        logger.info("Starting 6-axis pre-analysis...")
+        analysis_future = self._ctx_pool.submit(
+            self.personality.analyze_input,
+            user_input=user_input,
+            context=context
+        )
+
+        # Give the analysis a short budget; if it is slower than that,
+        # proceed with the previous turn's axes and collect the result
+        # after the chat call returns
         try:
-            logger.info("Starting 6-axis pre-analysis...")
-            self.current_analysis = self.personality.analyze_input(
-                user_input=user_input,
-                context=context
+            analysis = analysis_future.result(
+                timeout=self.config.get("analysis_budget_s", 0.8)
             )
-            if self.current_analysis:
-                input_axes = self.current_analysis.get("input_axes", {})
-                response_axes = self.current_analysis.get("response_axes", {})
-                logger.info(f"Pre-analysis complete: input_axes={input_axes}, response_axes={response_axes}")
+            if analysis:
+                self.current_analysis = analysis
+                # %-style defers the dict reprs until the record is emitted
+                logger.info("Pre-analysis complete: input_axes=%s, response_axes=%s",
+                            analysis.get("input_axes", {}), analysis.get("response_axes", {}))
+        except FutureTimeout:
+            logger.info("Pre-analysis still running; continuing with previous axes")
         except Exception as e:
             logger.warning(f"Pre-analysis failed: {e}")
 
         # Build full input with history
-        if self.conversation_history:
-            history_parts = []
-            for msg in self.conversation_history[-6:]:
-                role = "User" if msg["role"] == "user" else "Assistant"
-                history_parts.append(f"{role}: {msg['content']}")
+        if history_parts:
             full_input = "\n".join(history_parts) + f"\nUser: {user_input}"
         else:
             full_input = user_input
@@ -276,32 +500,41 @@ class AwarenessBackend:
         # Build system prompt with context injection
         system_prompt = self.build_system_prompt(user_input)
 
-        # Get MCP integrations from config
-        integrations = self.config.get("mcp_integrations", [])
-
-        # Call LM Studio
-        response, metadata = self.lm_api.chat_mcp(
-            input_text=full_input,
-            system_prompt=system_prompt,
-            integrations=integrations,
-            context_length=self.config.get("lm_studio", {}).get("context_length", 32000),
-        )
+        return analysis_future, full_input, system_prompt
 
+    def _finish_turn(self, user_input: str, response: str, analysis_future):
+        """Shared back half of a chat turn: history, memory, reflection"""
         # Update conversation history
-        self.conversation_history.append({"role": "user", "content": user_input})
-        self.conversation_history.append({"role": "assistant", "content": response})
+        self.history_roles.append(0)
+        self.history_contents.append(user_input)
+        self.history_roles.append(1)
+        self.history_contents.append(response)
 
         # Store for feedback
         self.last_user_input = user_input
         self.last_assistant_output = response
 
-        # Trim history
-        if len(self.conversation_history) > 20:
-            self.conversation_history = self.conversation_history[-20:]
+        # Collect the analysis if it finished while the chat ran
+        if analysis_future.done():
+            try:
+                analysis = analysis_future.result()
+                if analysis:
+                    self.current_analysis = analysis
+            except Exception as e:
+                logger.warning(f"Pre-analysis failed: {e}")
 
-        # Save to memory
+        # Save to memory (batched, same shape as MemorySystem.save_dialogue)
         try:
-            self.memory.save_dialogue(user_input, response)
+            self._queue_save(
+                content=user_input,
+                category="dialogue",
+                importance=3,
+                user_id="global",
+                metadata={
+                    "original_user_id": "global",
+                    "user_name": "unknown",
+                }
+            )
         except Exception as e:
             logger.error(f"Failed to save dialogue: {e}")
 
@@ -311,12 +544,91 @@ class AwarenessBackend:
             response_axes = self.current_analysis.get("response_axes", {})
             self.reflection_queue.put((user_input, response, input_axes, response_axes))
 
+    def send_message(self, user_input: str) -> tuple[str, dict]:
+        """
+        Send message and get response
+
+        Returns:
+            tuple: (response_text, metadata)
+        """
+        analysis_future, full_input, system_prompt = self._prepare_turn(user_input)
+
+        # Get MCP integrations from config
+        integrations = self.config.get("mcp_integrations", [])
+
+        # Call LM Studio
+        response, metadata = self.lm_api.chat_mcp(
+            input_text=full_input,
+            system_prompt=system_prompt,
+            integrations=integrations,
+            context_length=self.config.get("lm_studio", {}).get("context_length", 32000),
+        )
+
+        self._finish_turn(user_input, response, analysis_future)
         return response, metadata
 
+    def stream_message(self, user_input: str):
+        """
+        Send message, yielding response text fragments as they arrive.
+
+        Without MCP integrations the streaming chat endpoint is used and
+        fragments are yielded as LM Studio generates them. With
+        integrations the MCP response arrives as one JSON document, so the
+        full response is yielded in a single piece.
+        """
+        analysis_future, full_input, system_prompt = self._prepare_turn(user_input)
+
+        integrations = self.config.get("mcp_integrations", [])
+        if integrations:
+            response, _metadata = self.lm_api.chat_mcp(
+                input_text=full_input,
+                system_prompt=system_prompt,
+                integrations=integrations,
+                context_length=self.config.get("lm_studio", {}).get("context_length", 32000),
+            )
+            self._finish_turn(user_input, response, analysis_future)
+            yield response
+            return
+
+        parts = []
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": full_input},
+        ]
+        for fragment in self.lm_api.chat_simple_stream(messages):
+            parts.append(fragment)
+            yield fragment
+
+        self._finish_turn(user_input, "".join(parts), analysis_future)
+
     def get_current_reflection(self) -> Optional[dict]:
         """Get the most recent reflection result"""
         return self.current_reflection
 
+    def get_reflection_seq(self) -> int:
+        """Monotonic counter of completed reflections.
+
+        Lets the UI detect that a new reflection has landed since it sent
+        the message.
+        """
+        return self._reflection_seq
+
+    def wait_for_reflection(self, prev_seq: int, timeout: float = 0.5) -> bool:
+        """Block until a reflection newer than prev_seq lands, or timeout.
+
+        The processor signals completion on an event, so this returns as
+        soon as the reflection finishes rather than polling.
+        """
+        if self._reflection_seq != prev_seq:
+            return True
+        self._reflection_ready.clear()
+        # Re-check after the clear: the processor may have set the event
+        # between the first check and the clear
+        if self._reflection_seq != prev_seq:
+            return True
+        self._reflection_ready.wait(timeout)
+        return self._reflection_seq != prev_seq
+
     def get_current_analysis(self) -> Optional[dict]:
         """Get the most recent 6-axis analysis"""
         return self.current_analysis
@@ -387,18 +699,46 @@ class AwarenessBackend:
         """Manually trigger dreaming"""
         return self.dreaming.dream()
 
+    def get_dashboard_snapshot(self, feedback_n: int = 5) -> dict:
+        """Get everything the dashboard polls for, in one call.
+
+        The dashboard used to make separate round-trips for memory counts,
+        the dream threshold, dream stats and pending feedback; the first two
+        each recounted the same memory sources. This computes the threshold
+        once and derives the counts from it.
+        """
+        threshold = self.check_dream_threshold()
+        counts = {
+            "chromadb": threshold.get("primary_count", 0),
+            "moltbook": threshold.get("secondary_count", 0),
+            "total": threshold.get("current_count", 0),
+        }
+        return {
+            "counts": counts,
+            "threshold": threshold,
+            "dream_stats": self.dreaming.get_stats(),
+            "feedbacks": self.get_recent_user_feedback(feedback_n),
+        }
+
     def clear_conversation(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.flush()
+        self._context_cache.clear()
+        self.history_roles.clear()
+        self.history_contents.clear()
         self.current_reflection = None
         self.current_analysis = None
         self.last_user_input = ""
         self.last_assistant_output = ""
 
     def get_storage_info(self) -> dict:
-        """Get detailed storage information"""
+        """Get detailed storage information (cached for 5 seconds)"""
         import os
 
+        now = time.monotonic()
+        if self._storage_info_cache is not None and now - self._storage_info_time < 5.0:
+            return self._storage_info_cache
+
         # Data paths
         data_dir = self.data_dir
         chromadb_dir = data_dir / "chromadb"
@@ -407,19 +747,21 @@ class AwarenessBackend:
 
         # Count files and sizes
         def get_dir_size(path):
+            # os.scandir avoids per-file Path allocation of rglob + stat
             total = 0
-            if path.exists():
-                for f in path.rglob("*"):
-                    if f.is_file():
-                        total += f.stat().st_size
+            stack = [str(path)]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
             return total
 
-        def count_jsonl_lines(path):
-            if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    return sum(1 for _ in f)
-            return 0
-
         # Get counts
         memory_count = self.memory.count()
         reflection_count = count_jsonl_lines(personality_dir / "reflections.jsonl")
@@ -432,7 +774,7 @@ class AwarenessBackend:
         personality_size = get_dir_size(personality_dir)
         total_size = get_dir_size(data_dir)
 
-        return {
+        info = {
             "data_dir": str(data_dir.absolute()),
             "chromadb_dir": str(chromadb_dir.absolute()),
             "personality_dir": str(personality_dir.absolute()),
@@ -446,17 +788,18 @@ class AwarenessBackend:
             "total_size_mb": round(total_size / 1024 / 1024, 2),
         }
 
+        self._storage_info_cache = info
+        self._storage_info_time = now
+        return info
+
     def get_total_memory_count(self) -> dict:
         """Get memory counts from all sources"""
         chromadb_count = self.memory.count()
         moltbook_path = self.data_dir / "integrated_memory.jsonl"
-        moltbook_count = 0
-        if moltbook_path.exists():
-            try:
-                with open(moltbook_path, "r", encoding="utf-8") as f:
-                    moltbook_count = sum(1 for line in f if line.strip())
-            except Exception:
-                pass
+        try:
+            moltbook_count = count_jsonl_lines(moltbook_path)
+        except Exception:
+            moltbook_count = 0
         return {
             "chromadb": chromadb_count,
             "moltbook": moltbook_count,
@@ -466,9 +809,8 @@ class AwarenessBackend:
     def get_recent_memories(self, limit: int = 10) -> list[dict]:
         """Get recent memories from ChromaDB"""
         try:
-            # Search for recent items (use empty query to get all)
-            results = self.memory.search("", user_id="global", limit=limit)
-            return results
+            # collection.get path - no embedding cost for a plain listing
+            return self.memory.get_recent(user_id="global", limit=limit)
         except Exception as e:
             logger.error(f"Failed to get recent memories: {e}")
             return []
@@ -476,8 +818,7 @@ class AwarenessBackend:
     def get_memories_by_category(self, category: str, limit: int = 10) -> list[dict]:
         """Get memories by category"""
         try:
-            results = self.memory.search("", user_id="global", limit=limit, category=category)
-            return results
+            return self.memory.get_recent(user_id="global", limit=limit, category=category)
         except Exception as e:
             logger.error(f"Failed to get memories by category: {e}")
             return []
@@ -3,17 +3,205 @@ LM Studio API Client
 Handles communication with LM Studio's MCP API
 """
 
+import gzip
 import json
+import os
+import re
+import socket
+import time
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import blake2b
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json works too
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: enables streaming parse of large responses
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: typed decode of MCP responses
+    msgspec = None
+
+try:
+    import zstandard
+except ImportError:  # optional: better compression for remote deployments
+    zstandard = None
+
+if msgspec is not None:
+    class _MCPItem(msgspec.Struct):
+        """One entry of the MCP "output" array, decoded straight to a struct"""
+        type: str = ""
+        content: str = ""
+        tool: str = ""
+        arguments: object = None
+        output: object = None
+
+    class _MCPResponse(msgspec.Struct):
+        output: list[_MCPItem] = []
+        stats: dict = {}
+
+    _MCP_DECODER = msgspec.json.Decoder(_MCPResponse)
+else:
+    _MCP_DECODER = None
+
 logger = logging.getLogger(__name__)
 
+# Below this size a full parse is cheaper than setting up the stream parser
+_STREAM_MIN_BYTES = 16 * 1024
+
+# Fold the MCP memory event log into the snapshot once it grows past this
+_MCP_LOG_COMPACT_BYTES = 256 * 1024
+
+# Request bodies smaller than this aren't worth the compression CPU
+_COMPRESS_MIN_BYTES = 8 * 1024
+
+
+# Matches any mcp/memory tool name we know how to apply, regardless of the
+# "mcp__memory__"/"memory__" prefix variant LM Studio emits
+_MEMORY_TOOL_RE = re.compile(r"create_entities|add_observations|create_relations")
+
+
+def _handle_create_entities(args: dict, entity_map: dict, relations: list):
+    for entity in args.get("entities", []):
+        name = entity.get("name", "")
+        if name:
+            if name in entity_map:
+                # Merge observations - order-preserving dedup in one pass
+                old_obs = entity_map[name].get("observations", [])
+                new_obs = entity.get("observations", [])
+                entity_map[name]["observations"] = list(dict.fromkeys(chain(old_obs, new_obs)))
+                entity_map[name]["entityType"] = entity.get("entityType", entity_map[name].get("entityType", ""))
+            else:
+                entity_map[name] = entity
+
+
+def _handle_add_observations(args: dict, entity_map: dict, relations: list):
+    for obs in args.get("observations", []):
+        name = obs.get("entityName", "")
+        contents = obs.get("contents", [])
+        if name and name in entity_map:
+            old_obs = entity_map[name].get("observations", [])
+            entity_map[name]["observations"] = list(dict.fromkeys(chain(old_obs, contents)))
+        elif name:
+            entity_map[name] = {
+                "name": name,
+                "entityType": "auto",
+                "observations": contents
+            }
+
+
+def _handle_create_relations(args: dict, entity_map: dict, relations: list):
+    for rel in args.get("relations", []):
+        relations.append(rel)
+
+
+_MEMORY_HANDLERS = {
+    "create_entities": _handle_create_entities,
+    "add_observations": _handle_add_observations,
+    "create_relations": _handle_create_relations,
+}
+
+
+def apply_memory_event(tool_name: str, args: dict, entity_map: dict, relations: list):
+    """Apply one mcp/memory tool-call event to the entity/relation state.
+
+    Shared by compact_memory() and by readers that replay the event log on
+    top of the mcp_memory.json snapshot.
+    """
+    match = _MEMORY_TOOL_RE.search(tool_name)
+    if match:
+        _MEMORY_HANDLERS[match.group(0)](args, entity_map, relations)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data):
+    """Parse JSON from bytes/str (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _stream_mcp_output(raw):
+    """Incrementally parse an MCP response body.
+
+    Yields ("output.item", item_dict) for each entry of the "output" array
+    as soon as it is complete, then ("stats", stats_dict) - without ever
+    materializing the whole response tree in memory.
+    """
+    builder = None
+    target = None
+    for prefix, event, value in ijson.parse(raw):
+        if builder is None:
+            if prefix == "output.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                target = "output.item"
+            elif prefix == "stats" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                target = "stats"
+            continue
+        builder.event(event, value)
+        if event == "end_map" and prefix == target:
+            yield target, builder.value
+            builder = None
+
+
 # Default model for JIT loading (matching original Discord bot)
 DEFAULT_MODEL = "qwen/qwen3-30b-a3b-2507"
 
+# Payload skeletons copied per call instead of rebuilding the dict literals
+_MCP_PAYLOAD_TEMPLATE = {
+    "input": "",
+    "model": "",  # Required by MCP API
+    "system_prompt": "",
+    "integrations": None,
+    "context_length": 32000,
+    "temperature": 0.7,
+}
+
+_CHAT_PAYLOAD_TEMPLATE = {
+    "messages": None,
+    "temperature": 0.7,
+    "max_tokens": 2048,
+}
+
+
+class _TunedAdapter(HTTPAdapter):
+    """HTTPAdapter with socket options tuned for the local LM Studio link.
+
+    TCP_NODELAY avoids delayed-ack stalls on the small JSON payloads and
+    SO_KEEPALIVE keeps the pooled connection from being dropped silently
+    during long generations.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class LMStudioAPI:
     """LM Studio MCP API Client"""
@@ -36,48 +224,199 @@ class LMStudioAPI:
         self.openai_url = f"{self.base_url}/v1/chat/completions"
         self.models_url = f"{self.base_url}/api/v1/models"
 
-        # MCP memory bridge: save LLM's self-initiated memories
+        # MCP memory bridge: save LLM's self-initiated memories.
+        # mcp_memory.json is the compacted snapshot; mcp_memory.jsonl is an
+        # append-only event log folded into the snapshot by compact_memory()
         self.data_dir = data_dir or Path("./data")
         self.mcp_memory_file = self.data_dir / "mcp_memory.json"
+        self.mcp_memory_log = self.data_dir / "mcp_memory.jsonl"
+
+        # Persistent session: reuse the keep-alive connection to LM Studio
+        # instead of a new TCP handshake per request. Headers are attached
+        # once here rather than rebuilt per call
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        self._session.headers["Connection"] = "keep-alive"
+        if api_token:
+            self._session.headers["Authorization"] = f"Bearer {api_token}"
+        # One server, a handful of concurrent workers - size the pool to
+        # that instead of urllib3's defaults, with tuned socket options
+        self._session.mount(self.base_url, _TunedAdapter(pool_connections=2, pool_maxsize=8))
+
+        # Compress large request bodies only for remote hosts; on loopback
+        # the memory copies dominate any bandwidth saving
+        if host in ("localhost", "127.0.0.1", "::1"):
+            self.compression = None
+        elif zstandard is not None:
+            self.compression = "zstd"
+        else:
+            self.compression = "gzip"
+        if zstandard is not None:
+            self._session.headers["Accept-Encoding"] = "zstd, gzip"
+
+        # Short-TTL cache of the loaded-model lookup so chat_mcp doesn't
+        # hit /api/v1/models on every single turn
+        self._loaded_model_cache = (None, 0.0)
+        self._model_cache_ttl = 5.0
+
+        # Shared short-TTL cache of the parsed /api/v1/models list so
+        # connection checks and model lookups coalesce into one request
+        self._models_cache = None
+        self._models_cache_ttl = 2.0
+
+        # Lazily-created worker pool for the *_async variants
+        self._pool = None
+
+        # In-memory MCP state ({"entities": {name: e}, "relations": [...]}),
+        # lazily loaded from snapshot + log; avoids re-reading the files on
+        # every turn
+        self._mcp_state = None
+
+        # LRU of responses for (near-)deterministic prompts - a hash lookup
+        # replaces a multi-second LLM round-trip on repeats
+        self._resp_cache = OrderedDict()
+        self._resp_cache_max = 256
+        self._resp_cache_hits = 0
+
+        # Pre-serialized message prefixes for chat_simple_with_template,
+        # keyed by id() of the prefix list (the entry pins the list alive
+        # so the id stays valid)
+        self._prefix_cache = {}
+
+    # Stochastic outputs must not be cached; only near-greedy sampling is
+    _CACHEABLE_TEMPERATURE = 0.05
+
+    @staticmethod
+    def _cache_key(*parts: str) -> bytes:
+        return blake2b("\0".join(parts).encode("utf-8", "replace"), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes):
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            self._resp_cache.move_to_end(key)
+            self._resp_cache_hits += 1
+        return cached
+
+    def _cache_put(self, key: bytes, value):
+        self._resp_cache[key] = value
+        if len(self._resp_cache) > self._resp_cache_max:
+            self._resp_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached prompt responses"""
+        self._resp_cache.clear()
+        self._resp_cache_hits = 0
+
+    def _maybe_compress(self, body: bytes):
+        """Compress a large outgoing body for remote hosts.
+
+        Returns (body, extra_headers); extra_headers is None when the body
+        is sent as-is.
+        """
+        if self.compression is None or len(body) < _COMPRESS_MIN_BYTES:
+            return body, None
+        if self.compression == "zstd" and zstandard is not None:
+            return (
+                zstandard.ZstdCompressor(level=3).compress(body),
+                {"Content-Encoding": "zstd"},
+            )
+        return gzip.compress(body, compresslevel=3), {"Content-Encoding": "gzip"}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lmstudio")
+        return self._pool
+
+    def check_connection_async(self) -> Future:
+        """check_connection on a worker thread; returns a Future"""
+        return self._executor().submit(self.check_connection)
+
+    def chat_mcp_async(self, *args, **kwargs) -> Future:
+        """chat_mcp on a worker thread; returns a Future.
+
+        Lets callers overlap a health check or several reflective queries
+        with an in-flight generation instead of serializing on one call.
+        The shared session is thread-safe for GET/POST.
+        """
+        return self._executor().submit(self.chat_mcp, *args, **kwargs)
 
-    def _get_headers(self) -> dict:
-        """Get request headers"""
-        headers = {"Content-Type": "application/json"}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-        return headers
+    def chat_simple_async(self, *args, **kwargs) -> Future:
+        """chat_simple on a worker thread; returns a Future"""
+        return self._executor().submit(self.chat_simple, *args, **kwargs)
+
+    def chat_simple_batch(self, batch: list[dict]) -> list[str]:
+        """
+        Dispatch several independent chat_simple calls concurrently on the
+        shared worker pool and keep-alive session, instead of serializing
+        them end to end. Useful when the dreaming/reflection loop scores
+        several candidate thoughts.
+
+        Args:
+            batch: List of kwargs dicts for chat_simple
+
+        Returns:
+            Response texts, in input order
+        """
+        futures = [self._executor().submit(self.chat_simple, **item) for item in batch]
+        return [f.result() for f in futures]
+
+    def close(self):
+        """Close the underlying HTTP session and worker pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self._session.close()
+
+    def _fetch_models(self, force: bool = False) -> list[dict]:
+        """Fetch the models list, sharing one short-TTL cache across callers.
+
+        Raises on connection/HTTP errors; a failure is cached as the
+        exception itself and re-raised within the TTL, so a down server
+        isn't hammered but never masquerades as a successful empty fetch.
+        """
+        if not force and self._models_cache is not None:
+            cached, ts = self._models_cache
+            if time.monotonic() - ts < self._models_cache_ttl:
+                if isinstance(cached, Exception):
+                    raise cached
+                return cached
+
+        try:
+            response = self._session.get(self.models_url, timeout=5)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            self._models_cache = (e, time.monotonic())
+            raise
+
+        # Parse outside the try: a malformed 200 body is a real bug and
+        # should surface, not be swallowed as a connection problem
+        models = _loads(response.content).get("models", [])
+        self._models_cache = (models, time.monotonic())
+        return models
 
     def check_connection(self) -> dict:
         """Test connection to LM Studio"""
         try:
-            response = requests.get(
-                self.models_url,
-                headers=self._get_headers(),
-                timeout=5
-            )
+            models = self._fetch_models()
+            loaded_models = [m for m in models if m.get("loaded_instances")]
 
-            if response.status_code == 200:
-                data = response.json()
-                models = data.get("models", [])
-                loaded_models = [m for m in models if m.get("loaded_instances")]
-
-                return {
-                    "status": "connected",
-                    "total_models": len(models),
-                    "loaded_models": len(loaded_models),
-                    "loaded_model_names": [m["key"] for m in loaded_models]
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"HTTP {response.status_code}"
-                }
+            return {
+                "status": "connected",
+                "total_models": len(models),
+                "loaded_models": len(loaded_models),
+                "loaded_model_names": [m["key"] for m in loaded_models]
+            }
 
         except requests.exceptions.ConnectionError:
             return {
                 "status": "disconnected",
                 "error": "Cannot connect to LM Studio. Is it running?"
             }
+        except requests.exceptions.HTTPError as e:
+            return {
+                "status": "error",
+                "error": f"HTTP {e.response.status_code}"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -87,39 +426,32 @@ class LMStudioAPI:
     def get_available_models(self) -> list[str]:
         """Get list of available models"""
         try:
-            response = requests.get(
-                self.models_url,
-                headers=self._get_headers(),
-                timeout=5
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return [m["key"] for m in data.get("models", [])]
-        except:
-            pass
-        return []
+            return [m["key"] for m in self._fetch_models()]
+        except requests.exceptions.RequestException:
+            return []
 
     def get_loaded_model(self) -> Optional[str]:
         """Get currently loaded model - returns None if no model loaded (for JIT)"""
-        try:
-            response = requests.get(
-                self.models_url,
-                headers=self._get_headers(),
-                timeout=5
-            )
+        cached, ts = self._loaded_model_cache
+        if cached and time.monotonic() - ts < self._model_cache_ttl:
+            return cached
 
-            if response.status_code == 200:
-                data = response.json()
-                for model in data.get("models", []):
-                    if model.get("loaded_instances"):
-                        # Return the model key, not instance id
-                        return model.get("key", model["loaded_instances"][0]["id"])
-        except:
+        try:
+            for model in self._fetch_models():
+                if model.get("loaded_instances"):
+                    # Return the model key, not instance id
+                    key = model.get("key", model["loaded_instances"][0]["id"])
+                    self._loaded_model_cache = (key, time.monotonic())
+                    return key
+        except requests.exceptions.RequestException:
             pass
         # Return None to let JIT handle model loading
         return None
 
+    def invalidate_model_cache(self):
+        """Drop the cached loaded model (call after loading/unloading models)"""
+        self._loaded_model_cache = (None, 0.0)
+
     def chat_mcp(
         self,
         input_text: str,
@@ -146,72 +478,99 @@ class LMStudioAPI:
         if integrations is None:
             integrations = ["mcp/sequential-thinking", "mcp/memory"]
 
-        # Get currently loaded model - MCP API requires model parameter
-        # If no model loaded, use DEFAULT_MODEL for JIT loading (matching original Discord bot)
-        if not model:
-            model = self.get_loaded_model()
-
-        if not model:
-            # JIT mode: use default model, LM Studio will auto-load it
-            model = DEFAULT_MODEL
-            logger.info(f"No model loaded, JIT will load: {model}")
-
-        payload = {
-            "input": input_text,
-            "model": model,  # Required by MCP API
-            "system_prompt": system_prompt,
-            "integrations": integrations,
-            "context_length": context_length,
-            "temperature": temperature,
-        }
+        # MCP API requires a model parameter; fall back to the cached
+        # loaded-model lookup, then to DEFAULT_MODEL for JIT auto-loading
+        # (matching original Discord bot)
+        model = model or self.get_loaded_model() or DEFAULT_MODEL
+
+        cache_key = None
+        if temperature <= self._CACHEABLE_TEMPERATURE:
+            cache_key = self._cache_key(system_prompt, input_text, model, f"{temperature:.3f}")
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        payload = _MCP_PAYLOAD_TEMPLATE.copy()
+        payload["input"] = input_text
+        payload["model"] = model
+        payload["system_prompt"] = system_prompt
+        payload["integrations"] = integrations
+        payload["context_length"] = context_length
+        payload["temperature"] = temperature
 
         try:
-            logger.info(f"MCP API call - Model: {model}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("MCP API call - Model: %s", model)
 
-            response = requests.post(
+            body, extra_headers = self._maybe_compress(_dumps(payload))
+            response = self._session.post(
                 self.mcp_url,
-                headers=self._get_headers(),
-                json=payload,
-                timeout=self.timeout
+                data=body,
+                headers=extra_headers,
+                timeout=self.timeout,
+                stream=True
             )
 
             if response.status_code != 200:
-                error_detail = response.text[:500] if response.text else "No details"
+                raw = response.content
+                error_detail = raw[:500].decode("utf-8", errors="replace") if raw else "No details"
                 logger.error(f"MCP API error: {response.status_code} - {error_detail}")
                 return f"API Error: {response.status_code} - {error_detail}", {"error": True}
 
-            result = response.json()
-
             # Parse response
             messages = []
             tool_calls = []
-
-            for item in result.get("output", []):
-                item_type = item.get("type")
-
-                if item_type == "message":
-                    content = item.get("content", "")
-                    if content:
-                        messages.append(content)
-
-                elif item_type == "tool_call":
-                    tool_calls.append({
-                        "tool": item.get("tool"),
-                        "arguments": item.get("arguments"),
-                        "output": item.get("output"),
-                    })
+            stats = {}
+
+            # Stream-parse large bodies so tool-call chains are consumed one
+            # item at a time instead of materializing the whole tree
+            content_length = int(response.headers.get("Content-Length") or 0)
+            if ijson is not None and (content_length == 0 or content_length >= _STREAM_MIN_BYTES):
+                response.raw.decode_content = True
+                for kind, item in _stream_mcp_output(response.raw):
+                    if kind == "stats":
+                        stats = item or {}
+                    else:
+                        self._dispatch_output_item(item, messages, tool_calls)
+            elif _MCP_DECODER is not None:
+                # Typed decode: attribute access on structs instead of a
+                # dict .get() chain per field
+                result = _MCP_DECODER.decode(response.content)
+                stats = result.stats
+                for item in result.output:
+                    if item.type == "message":
+                        if item.content:
+                            messages.append(item.content)
+                    elif item.type == "tool_call":
+                        tool_calls.append({
+                            "tool": item.tool,
+                            "arguments": item.arguments,
+                            "output": item.output,
+                        })
+            else:
+                result = _loads(response.content)
+                stats = result.get("stats", {})
+                for item in result.get("output", []):
+                    self._dispatch_output_item(item, messages, tool_calls)
 
             response_text = "\n".join(messages).strip() or "No response"
 
+            # The call succeeded with this model, so remember it and skip
+            # the pre-flight models GET on the next turns
+            self._loaded_model_cache = (model, time.monotonic())
+
             # Extract and save MCP memory tool calls
             if tool_calls:
                 self._extract_mcp_memory(tool_calls)
 
             metadata = {
                 "tool_calls": tool_calls,
-                "stats": result.get("stats", {}),
+                "stats": stats,
             }
 
+            if cache_key is not None:
+                self._cache_put(cache_key, (response_text, metadata))
+
             return response_text, metadata
 
         except requests.exceptions.Timeout:
@@ -220,6 +579,23 @@ class LMStudioAPI:
             logger.error(f"MCP API exception: {e}")
             return f"Error: {str(e)}", {"error": True}
 
+    @staticmethod
+    def _dispatch_output_item(item: dict, messages: list, tool_calls: list):
+        """Route one dict-form output item into messages/tool_calls"""
+        item_type = item.get("type")
+
+        if item_type == "message":
+            content = item.get("content", "")
+            if content:
+                messages.append(content)
+
+        elif item_type == "tool_call":
+            tool_calls.append({
+                "tool": item.get("tool"),
+                "arguments": item.get("arguments"),
+                "output": item.get("output"),
+            })
+
     def _extract_mcp_memory(self, tool_calls: list):
         """Extract mcp/memory tool calls and save to mcp_memory.json
 
@@ -232,87 +608,135 @@ class LMStudioAPI:
 
         memory_calls = [
             tc for tc in tool_calls
-            if tc.get("tool", "").startswith("mcp__memory__")
-            or tc.get("tool", "").startswith("memory__")
-            or "create_entities" in tc.get("tool", "")
-            or "add_observations" in tc.get("tool", "")
-            or "create_relations" in tc.get("tool", "")
+            if _MEMORY_TOOL_RE.search(tc.get("tool", ""))
         ]
 
         if not memory_calls:
             return
 
-        # Load existing MCP memory
-        existing = {"entities": [], "relations": []}
-        if self.mcp_memory_file.exists():
-            try:
-                with open(self.mcp_memory_file, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-            except Exception:
-                pass
+        state = self._get_mcp_state()
+
+        # Append one event per call to the log - O(delta) disk I/O per turn
+        # instead of rewriting the whole memory file - while mirroring the
+        # same events onto the in-memory state
+        try:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.mcp_memory_log, "ab") as f:
+                for tc in memory_calls:
+                    args = tc.get("arguments", {})
+                    if isinstance(args, str):
+                        try:
+                            args = _loads(args)
+                        except Exception:
+                            continue
+                    tool_name = tc.get("tool", "")
+                    event = {
+                        "ts": time.time(),
+                        "tool": tool_name,
+                        "args": args,
+                    }
+                    f.write(_dumps(event) + b"\n")
+                    apply_memory_event(tool_name, args, state["entities"], state["relations"])
+            logger.info(f"MCP memory: logged {len(memory_calls)} events")
+        except Exception as e:
+            logger.error(f"Failed to log MCP memory events: {e}")
+            return
 
-        entity_map = {e["name"]: e for e in existing.get("entities", [])}
-        relations = existing.get("relations", [])
+        # Fold the log back into the snapshot once it grows large
+        try:
+            if self.mcp_memory_log.stat().st_size >= _MCP_LOG_COMPACT_BYTES:
+                self.compact_memory()
+        except OSError:
+            pass
 
-        for tc in memory_calls:
-            tool_name = tc.get("tool", "")
-            args = tc.get("arguments", {})
+    def _get_mcp_state(self) -> dict:
+        """Lazily load snapshot + pending log into memory, once per process"""
+        if self._mcp_state is None:
+            entity_map = {}
+            relations = []
 
-            # Parse arguments if string
-            if isinstance(args, str):
+            if self.mcp_memory_file.exists():
                 try:
-                    args = json.loads(args)
+                    existing = _loads(self.mcp_memory_file.read_bytes())
+                    raw_entities = existing.get("entities", [])
+                    if isinstance(raw_entities, dict):
+                        # v2 on-disk format: already keyed by name
+                        entity_map = raw_entities
+                    else:
+                        # v1 list format: migrated to v2 on next compaction
+                        entity_map = {e["name"]: e for e in raw_entities}
+                    relations = existing.get("relations", [])
                 except Exception:
-                    continue
+                    pass
 
-            if "create_entities" in tool_name:
-                for entity in args.get("entities", []):
-                    name = entity.get("name", "")
-                    if name:
-                        if name in entity_map:
-                            # Merge observations
-                            old_obs = entity_map[name].get("observations", [])
-                            new_obs = entity.get("observations", [])
-                            merged = list(set(old_obs + new_obs))
-                            entity_map[name]["observations"] = merged
-                            entity_map[name]["entityType"] = entity.get("entityType", entity_map[name].get("entityType", ""))
-                        else:
-                            entity_map[name] = entity
-
-            elif "add_observations" in tool_name:
-                observations = args.get("observations", [])
-                for obs in observations:
-                    name = obs.get("entityName", "")
-                    contents = obs.get("contents", [])
-                    if name and name in entity_map:
-                        old_obs = entity_map[name].get("observations", [])
-                        merged = list(set(old_obs + contents))
-                        entity_map[name]["observations"] = merged
-                    elif name:
-                        entity_map[name] = {
-                            "name": name,
-                            "entityType": "auto",
-                            "observations": contents
-                        }
-
-            elif "create_relations" in tool_name:
-                for rel in args.get("relations", []):
-                    relations.append(rel)
-
-        # Save updated MCP memory
+            if self.mcp_memory_log.exists():
+                try:
+                    with open(self.mcp_memory_log, "rb") as f:
+                        for line in f:
+                            line = line.strip()
+                            if not line:
+                                continue
+                            try:
+                                event = _loads(line)
+                            except Exception:
+                                continue
+                            apply_memory_event(
+                                event.get("tool", ""),
+                                event.get("args", {}),
+                                entity_map,
+                                relations
+                            )
+                except Exception as e:
+                    logger.error(f"Failed to replay MCP memory log: {e}")
+
+            self._mcp_state = {"entities": entity_map, "relations": relations}
+        return self._mcp_state
+
+    def _save_mcp_memory(self, updated: dict, durable: bool = False):
+        """Atomically write mcp_memory.json via temp file + os.replace.
+
+        A crash mid-write leaves the old snapshot intact instead of a
+        truncated file; durable=True additionally fsyncs before the rename.
+        """
+        if orjson is not None:
+            data = orjson.dumps(updated, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(updated, ensure_ascii=False, indent=2).encode("utf-8")
+
+        tmp = self.mcp_memory_file.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, self.mcp_memory_file)
+
+    def compact_memory(self, durable: bool = False):
+        """Persist the in-memory state to mcp_memory.json and truncate the log"""
+        state = self._get_mcp_state()
+        entity_map = state["entities"]
+        relations = state["relations"]
+
+        # Save updated MCP memory - v2 keeps entities keyed by name on disk
+        # so no list<->dict round trip is needed at load or save time
         updated = {
-            "entities": list(entity_map.values()),
+            "version": 2,
+            "entities": entity_map,
             "relations": relations
         }
 
         try:
             self.data_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.mcp_memory_file, "w", encoding="utf-8") as f:
-                json.dump(updated, f, ensure_ascii=False, indent=2)
-            logger.info(f"MCP memory saved: {len(entity_map)} entities, {len(relations)} relations")
+            self._save_mcp_memory(updated, durable=durable)
+            self.mcp_memory_log.write_bytes(b"")
+            logger.info(f"MCP memory compacted: {len(entity_map)} entities, {len(relations)} relations")
         except Exception as e:
             logger.error(f"Failed to save MCP memory: {e}")
 
+    def flush(self):
+        """Force-persist the MCP memory snapshot (fsynced); call at shutdown"""
+        self.compact_memory(durable=True)
+
     def chat_simple(
         self,
         messages: list[dict],
@@ -330,23 +754,150 @@ class LMStudioAPI:
         Returns:
             Response text
         """
+        cache_key = None
+        if temperature <= self._CACHEABLE_TEMPERATURE:
+            cache_key = self._cache_key(
+                _dumps(messages).decode("utf-8"), f"{temperature:.3f}", str(max_tokens)
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        payload = _CHAT_PAYLOAD_TEMPLATE.copy()
+        payload["messages"] = messages
+        payload["temperature"] = temperature
+        payload["max_tokens"] = max_tokens
+
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.openai_url,
-                headers=self._get_headers(),
-                json={
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens
-                },
+                data=_dumps(payload),
                 timeout=self.timeout
             )
 
             if response.status_code == 200:
-                return response.json()["choices"][0]["message"]["content"]
+                content = _loads(response.content)["choices"][0]["message"]["content"]
+                if cache_key is not None:
+                    self._cache_put(cache_key, content)
+                return content
             else:
                 return ""
 
-        except Exception as e:
+        except requests.exceptions.Timeout:
+            logger.warning("Simple chat timed out")
+            return ""
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Simple chat error: {e}")
+            return ""
+
+    def chat_simple_with_template(
+        self,
+        prefix_messages: list[dict],
+        user_msg: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> str:
+        """
+        chat_simple specialized for a fixed message prefix (system prompt,
+        few-shot examples). The prefix is serialized once per template, so
+        per-call JSON encoding covers only the user message and sampling
+        params - useful for tight reflection/habit-evaluation loops.
+
+        Args:
+            prefix_messages: Fixed leading messages, reused across calls
+            user_msg: The variable user message appended per call
+            temperature: Temperature
+            max_tokens: Max tokens
+
+        Returns:
+            Response text
+        """
+        cached = self._prefix_cache.get(id(prefix_messages))
+        if cached is None or cached[0] is not prefix_messages:
+            # Serialize the wrapper once and strip the closing "]}" so the
+            # user message can be spliced in per call
+            prefix_bytes = _dumps({"messages": prefix_messages})[:-2]
+            self._prefix_cache[id(prefix_messages)] = (prefix_messages, prefix_bytes)
+        else:
+            prefix_bytes = cached[1]
+
+        body = b"".join((
+            prefix_bytes,
+            b"," if prefix_messages else b"",
+            _dumps({"role": "user", "content": user_msg}),
+            b'],"temperature":', repr(float(temperature)).encode("ascii"),
+            b',"max_tokens":', str(max_tokens).encode("ascii"),
+            b"}",
+        ))
+
+        try:
+            response = self._session.post(
+                self.openai_url,
+                data=body,
+                timeout=self.timeout
+            )
+
+            if response.status_code == 200:
+                return _loads(response.content)["choices"][0]["message"]["content"]
+            else:
+                return ""
+
+        except requests.exceptions.Timeout:
+            logger.warning("Simple chat timed out")
+            return ""
+        except requests.exceptions.RequestException as e:
             logger.error(f"Simple chat error: {e}")
             return ""
+
+    def chat_simple_stream(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ):
+        """
+        Streaming variant of chat_simple - yields text chunks as LM Studio
+        generates them, so callers can render progressively instead of
+        waiting for the full completion.
+
+        Args:
+            messages: List of message dicts
+            temperature: Temperature
+            max_tokens: Max tokens
+
+        Yields:
+            Response text fragments
+        """
+        try:
+            response = self._session.post(
+                self.openai_url,
+                data=_dumps({
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "stream": True
+                }),
+                timeout=self.timeout,
+                stream=True
+            )
+
+            if response.status_code != 200:
+                logger.error(f"Streaming chat error: HTTP {response.status_code}")
+                return
+
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                chunk = line[len("data: "):]
+                if chunk == "[DONE]":
+                    break
+                try:
+                    delta = _loads(chunk)["choices"][0].get("delta", {})
+                except Exception:
+                    continue
+                content = delta.get("content")
+                if content:
+                    yield content
+
+        except Exception as e:
+            logger.error(f"Streaming chat error: {e}")
@@ -8,19 +8,43 @@ Simplified UI:
 - User free-text feedback
 """
 
+import asyncio
+import os
 import gradio as gr
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
+import threading
 import time
 import logging
 import json
 
+try:
+    import orjson  # Optional: C-extension JSON parser for the log readers
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Single persistent worker for manual Moltbook cycles: a click dispatches the
+# 30-60s cycle here and returns instead of holding a Gradio worker for it
+_MANUAL_CYCLE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="manual-cycle"
+)
+
+# Process-wide IntegratedAgent: every browser session shares one instance so
+# multiple tabs don't spin up duplicate background threads and feed fetches
+_INTEGRATED_AGENT = None
+_INTEGRATED_AGENT_LOCK = threading.Lock()
+
 from .config import load_config, save_config
 from .api import AwarenessBackend
 from .utils.formatters import format_insight_list
 
-# Import Moltbook Agent and Integrated Agent
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Moltbook Agent and Integrated Agent. The app is launched as
+# `python -m awareness_ui` from the repo root (see start.sh/start.bat),
+# so the top-level engines package is importable without path surgery.
 from engines.moltbook_agent import MoltbookAgent
 from engines.integrated_agent import IntegratedAgent
 
@@ -71,35 +95,335 @@ CUSTOM_CSS = """
 """
 
 
-def format_axes_display(axes: dict, title: str = "") -> str:
-    """Format 6-axis data for display"""
-    if not axes:
-        return ""
+# ========== Incremental JSONL tailing ==========
+#
+# The dashboard logs are append-only; instead of rescanning them from byte 0
+# on every refresh, remember (inode, consumed size, accumulated state) per
+# file and parse only the newly-appended lines.
 
-    axis_info = [
-        ("analysis_overview", "分析－俯瞰", "分析", "俯瞰"),
-        ("individual_collective", "個　－集団", "個　", "集団"),
-        ("empathy_responsibility", "共感－責任", "共感", "責任"),
-        ("cooperation_independence", "協調－自立", "協調", "自立"),
-        ("stability_transformation", "安定－変容", "安定", "変容"),
-        ("divergence_convergence", "拡散－収束", "拡散", "収束"),
-    ]
+_TAIL_CACHE = {}
 
-    lines = []
-    if title:
-        lines.append(f"**{title}**\n")
 
-    for key, name, neg_label, pos_label in axis_info:
-        value = axes.get(key, 0)
-        # Create visual bar (20 chars wide)
-        bar_pos = int((value + 5) / 10 * 20)
-        bar = "░" * bar_pos + "█" + "░" * (20 - bar_pos)
-        sign = "+" if value > 0 else ""
-        lines.append(f"{neg_label} [{bar}] {pos_label} **{sign}{value}**")
+def _scan_jsonl_increment(path: Path, state_factory, apply_line):
+    """Feed newly-appended JSONL lines of an append-only log into a state dict.
+
+    Returns the accumulated state. Truncated/replaced files (shrunk size or
+    changed inode) reset the state and rescan; a partially-written last line
+    is left for the next call. The cursor is kept per (path, reader) so
+    several readers can tail the same log independently.
+    """
+    key = (str(path), apply_line.__qualname__)
+    cached = _TAIL_CACHE.get(key)
+
+    try:
+        st = path.stat()
+    except (FileNotFoundError, OSError):
+        _TAIL_CACHE.pop(key, None)
+        return state_factory()
+
+    if cached is None or st.st_ino != cached["ino"] or st.st_size < cached["size"]:
+        cached = {"ino": st.st_ino, "size": 0, "state": state_factory(),
+                  "parse_errors": 0}
+        _TAIL_CACHE[key] = cached
+
+    if st.st_size == cached["size"]:
+        return cached["state"]
+
+    with open(path, "rb") as f:
+        f.seek(cached["size"])
+        data = f.read()
+
+    end = data.rfind(b"\n")
+    if end < 0:
+        return cached["state"]
+
+    state = cached["state"]
+    for line in data[:end].split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = _json_loads(line)
+        except (json.JSONDecodeError, ValueError):
+            # Malformed line (e.g. the writer died mid-line); count it so
+            # truncation shows up in the dashboard instead of vanishing
+            cached["parse_errors"] += 1
+            continue
+        apply_line(state, entry)
+    cached["size"] += end + 1
+    return state
+
+
+_RENDER_CACHE = {}
+
+
+def _rendered_if_unchanged(name: str, path: Path):
+    """Return (key, cached_markdown) for a render cache keyed on file stat.
+
+    cached_markdown is None when the file changed since the last render
+    (or was never rendered); key is passed to _store_rendered afterwards.
+    """
+    try:
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except (FileNotFoundError, OSError):
+        key = None
+    cached = _RENDER_CACHE.get(name)
+    if key is not None and cached is not None and cached[0] == key:
+        return key, cached[1]
+    return key, None
+
+
+def _store_rendered(name: str, key, rendered: str):
+    if key is not None:
+        _RENDER_CACHE[name] = (key, rendered)
+
+
+def _total_parse_errors() -> int:
+    """Malformed log lines seen across all tailed files"""
+    return sum(c.get("parse_errors", 0) for c in _TAIL_CACHE.values())
+
+
+def _new_count_state():
+    return {"lines": 0}
+
+
+def _apply_count_line(state, _entry):
+    state["lines"] += 1
+
+
+def _count_jsonl_lines(path: Path) -> int:
+    """Line count of an append-only log, cached across restarts.
+
+    A sidecar file (``.<name>.count``) persists (inode, size, count) so a
+    fresh process only counts bytes appended since the last run instead of
+    rescanning the whole log from byte 0.
+    """
+    key = (str(path), _apply_count_line.__qualname__)
+    sidecar = path.with_name(f".{path.name}.count")
+
+    if key not in _TAIL_CACHE:
+        # Seed the in-memory cursor from the sidecar when it still matches
+        try:
+            snap = _json_loads(sidecar.read_bytes())
+            st = path.stat()
+            if snap["ino"] == st.st_ino and snap["size"] <= st.st_size:
+                _TAIL_CACHE[key] = {
+                    "ino": snap["ino"],
+                    "size": snap["size"],
+                    "state": {"lines": snap["count"]},
+                    "parse_errors": 0,
+                    "persisted": snap["size"],
+                }
+        except Exception:
+            pass
+
+    state = _scan_jsonl_increment(path, _new_count_state, _apply_count_line)
+
+    cached = _TAIL_CACHE.get(key)
+    if cached is not None and cached.get("persisted") != cached["size"]:
+        try:
+            tmp = sidecar.with_name(sidecar.name + ".tmp")
+            tmp.write_text(json.dumps({
+                "ino": cached["ino"],
+                "size": cached["size"],
+                "count": state["lines"],
+            }))
+            os.replace(tmp, sidecar)
+            cached["persisted"] = cached["size"]
+        except OSError:
+            pass
+    return state["lines"]
+
+
+def _new_activity_state():
+    # One state serves the dashboard totals, the recent-activity tab and
+    # the comments-history tab, so the log is parsed once for all three
+    return {
+        "cycles": 0,
+        "actions": Counter(),
+        "reflections": deque(maxlen=5),
+        "recent": deque(maxlen=15),
+        "comments": deque(maxlen=20),
+    }
+
+
+def _apply_activity_line(state, act):
+    state["cycles"] += 1
+    timestamp = act.get("timestamp", "")
+    steps = act.get("details", {}).get("steps", {})
+    results = steps.get("execution", {}).get("results", ())
+
+    # Tally successful actions by type in one pass; the per-cycle counts
+    # also feed the recent-activity summary
+    cycle_actions = Counter(
+        r.get("type")
+        for r in results
+        if r.get("result", {}).get("success")
+    )
+    state["actions"].update(cycle_actions)
+    state["recent"].append({
+        "timestamp": timestamp[:19],
+        "cycle": act.get("cycle", 0),
+        "posts": cycle_actions["post"],
+        "comments": cycle_actions["comment"],
+        "replies": cycle_actions["reply"],
+    })
+
+    # Collect posted comments/replies for the history tab
+    for r in results:
+        rtype = r.get("type")
+        result_data = r.get("result", {})
+        if rtype in ("comment", "reply") and result_data.get("success"):
+            comment_data = result_data.get("comment", {})
+            state["comments"].append({
+                "timestamp": timestamp[:19],
+                "type": rtype,
+                "target_post": r.get("target", ""),
+                "parent": r.get("parent", ""),
+                "content": comment_data.get("content", ""),
+                "comment_id": comment_data.get("id", "")[:8]
+            })
+
+    # Collect reflections
+    reflection = steps.get("reflection", {})
+    if reflection.get("insight"):
+        state["reflections"].append({
+            "timestamp": timestamp[:16],
+            "insight": reflection.get("insight", "")
+        })
+
+
+def _new_insights_state():
+    return {"count": 0, "recent": deque(maxlen=5)}
+
+
+def _apply_insight_line(state, entry):
+    state["count"] += 1
+    state["recent"].append(entry)
+
+
+_AXIS_INFO = (
+    ("analysis_overview", "分析－俯瞰", "分析", "俯瞰"),
+    ("individual_collective", "個　－集団", "個　", "集団"),
+    ("empathy_responsibility", "共感－責任", "共感", "責任"),
+    ("cooperation_independence", "協調－自立", "協調", "自立"),
+    ("stability_transformation", "安定－変容", "安定", "変容"),
+    ("divergence_convergence", "拡散－収束", "拡散", "収束"),
+)
+
+# All 21 possible visual bars (20 chars wide, cursor at position 0-20),
+# precomputed so the render path is a lookup instead of string multiplication
+_BARS = tuple("░" * i + "█" + "░" * (20 - i) for i in range(21))
+
+_AXIS_ROW_TMPL = "{neg} [{bar}] {pos} **{sign}{v}**"
+
+
+@functools.lru_cache(maxsize=64)
+def _format_axes_cached(values: tuple, title: str) -> str:
+    """Render the six axis rows for one canonical value tuple"""
+    lines = [
+        _AXIS_ROW_TMPL.format(
+            neg=neg_label,
+            bar=_BARS[max(0, min(20, int((value + 5) * 2)))],
+            pos=pos_label,
+            sign="+" if value > 0 else "",
+            v=value,
+        )
+        for value, (key, name, neg_label, pos_label) in zip(values, _AXIS_INFO)
+    ]
+    if title:
+        lines.insert(0, f"**{title}**\n")
 
     return "\n\n".join(lines)
 
 
+def format_axes_display(axes: dict, title: str = "") -> str:
+    """Format 6-axis data for display
+
+    Unchanged axes (refresh spam, re-renders) hit the memoized rendering
+    keyed on the value tuple instead of rebuilding the markdown.
+    """
+    if not axes:
+        return ""
+    values = tuple(axes.get(key, 0) for key, *_ in _AXIS_INFO)
+    return _format_axes_cached(values, title)
+
+
+def _ttl_cached(ttl: float = 2.0):
+    """Memoise a zero-side-effect callable per argument tuple for *ttl* seconds.
+
+    Meant for backend queries the dashboard re-issues on every refresh; a
+    couple of seconds of staleness is invisible in the UI but spares the
+    disk/Chroma lookups when refresh is mashed.
+    """
+    def decorate(fn):
+        cache = {}
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+            result = fn(*args)
+            cache[args] = (now, result)
+            return result
+
+        return wrapper
+    return decorate
+
+
+def _single_flight(fn):
+    """Coalesce concurrent invocations of a zero-argument coroutine.
+
+    Dashboard-style handlers compute the same answer for every caller;
+    while one computation is in flight, additional callers await that
+    same task instead of starting another file-read pass.
+    """
+    state = {"task": None}
+
+    @functools.wraps(fn)
+    async def wrapper():
+        task = state["task"]
+        if task is None or task.done():
+            task = asyncio.ensure_future(fn())
+            state["task"] = task
+        # shield: one client disconnecting must not cancel the shared task
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+class _LazyBackend:
+    """Defers AwarenessBackend construction to the first real call.
+
+    Building the backend opens ChromaDB and warms the memory stores, which
+    takes seconds on a cold disk. Constructing it lazily lets the Gradio UI
+    bind its port immediately; a user who only opens the settings tab never
+    pays the init cost at all.
+    """
+    __slots__ = ("_backend", "_config", "_data_dir", "_lock")
+
+    def __init__(self, config, data_dir):
+        self._backend = None
+        self._config = config
+        self._data_dir = data_dir
+        self._lock = threading.Lock()
+
+    def _ensure(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = AwarenessBackend(
+                        self._config, data_dir=self._data_dir
+                    )
+        return self._backend
+
+    def __getattr__(self, name):
+        return getattr(self._ensure(), name)
+
+
 def create_app():
     """Create and configure the Gradio app"""
 
@@ -109,27 +433,56 @@ def create_app():
     # API token should be configured in user_config.json
     # Get it from LM Studio > Settings > Developer
 
-    # Initialize backend
-    backend = AwarenessBackend(config, data_dir=DATA_DIR)
+    # Backend init is deferred to the first handler that touches it
+    backend = _LazyBackend(config, data_dir=DATA_DIR)
+
+    # Short-TTL view of the fused backend query the dashboard polls
+    # repeatedly (the lambda keeps the backend lazy at build time)
+    get_dashboard_snapshot = _ttl_cached()(
+        lambda: backend.get_dashboard_snapshot()
+    )
 
     # ========== Event Handlers ==========
 
-    def send_message(user_input, chat_history):
-        """Handle message send"""
+    async def send_message(user_input, chat_history):
+        """Handle message send, streaming the response into the chatbot"""
         if not user_input.strip():
-            return chat_history, "", "", "", ""
+            yield chat_history, "", "", "", ""
+            return
 
         chat_history = chat_history or []
 
-        # Get response
-        response, metadata = backend.send_message(user_input)
+        # Remember which reflection was current before this turn so we can
+        # detect the new one landing
+        prev_reflection_seq = backend.get_reflection_seq()
 
-        # Update chat history
         chat_history.append({"role": "user", "content": user_input})
-        chat_history.append({"role": "assistant", "content": response})
+        chat_history.append({"role": "assistant", "content": ""})
+
+        # The backend generator blocks on the LLM; run it on a worker
+        # thread and hand fragments to the event loop through a queue so
+        # partial responses render as they arrive
+        loop = asyncio.get_running_loop()
+        fragments = asyncio.Queue()
+
+        def _produce():
+            try:
+                for fragment in backend.stream_message(user_input):
+                    loop.call_soon_threadsafe(fragments.put_nowait, fragment)
+            finally:
+                loop.call_soon_threadsafe(fragments.put_nowait, None)
+
+        producer = loop.run_in_executor(None, _produce)
+        while True:
+            fragment = await fragments.get()
+            if fragment is None:
+                break
+            chat_history[-1]["content"] += fragment
+            yield chat_history, "", gr.update(), gr.update(), gr.update()
+        await producer
 
         # Get 6-axis analysis
-        analysis = backend.get_current_analysis()
+        analysis = await asyncio.to_thread(backend.get_current_analysis)
 
         input_axes_text = ""
         response_axes_text = ""
@@ -140,11 +493,14 @@ def create_app():
             input_axes_text = format_axes_display(input_axes, "入力の6軸分析")
             response_axes_text = format_axes_display(response_axes, "応答人格の6軸")
 
-        # Wait briefly for background reflection
-        time.sleep(0.3)
+        # Wait for the background reflection, returning as soon as the
+        # processor signals completion (max wait 500ms)
+        await asyncio.to_thread(
+            backend.wait_for_reflection, prev_reflection_seq, 0.5
+        )
 
         # Get reflection insight
-        reflection = backend.get_current_reflection()
+        reflection = await asyncio.to_thread(backend.get_current_reflection)
         insight_text = ""
         if reflection:
             insight = reflection.get("insight", "")
@@ -153,12 +509,13 @@ def create_app():
         else:
             insight_text = "*振り返り処理中...*"
 
-        return chat_history, "", input_axes_text, response_axes_text, insight_text
+        yield chat_history, "", input_axes_text, response_axes_text, insight_text
 
-    def refresh_insight():
+    @_single_flight
+    async def refresh_insight():
         """Refresh insight display"""
-        analysis = backend.get_current_analysis()
-        reflection = backend.get_current_reflection()
+        analysis = await asyncio.to_thread(backend.get_current_analysis)
+        reflection = await asyncio.to_thread(backend.get_current_reflection)
 
         input_axes_text = ""
         response_axes_text = ""
@@ -177,12 +534,12 @@ def create_app():
 
         return input_axes_text, response_axes_text, insight_text
 
-    def submit_feedback(feedback_text):
+    async def submit_feedback(feedback_text):
         """Submit user free-text feedback"""
         if not feedback_text.strip():
             return "フィードバックを入力してください", ""
 
-        success = backend.submit_user_feedback(feedback_text)
+        success = await asyncio.to_thread(backend.submit_user_feedback, feedback_text)
         if success:
             return "✅ フィードバックを保存しました（夢見モードで処理されます）", ""
         return "❌ 保存に失敗しました", feedback_text
@@ -220,94 +577,70 @@ def create_app():
             return "設定を保存しました"
         return "設定の保存に失敗しました"
 
-    def get_dashboard_data():
+    # app.load refires on every websocket reconnect; serve the last
+    # rendered snapshot for a few seconds instead of recomputing
+    _dash_cache = {"ts": 0.0, "value": None}
+
+    @_single_flight
+    async def get_dashboard_data():
         """Get dashboard statistics - focused on Moltbook activity"""
+        if (_dash_cache["value"] is not None
+                and time.monotonic() - _dash_cache["ts"] < 5.0):
+            return _dash_cache["value"]
         try:
-            # Get Moltbook integrated memory count
-            integrated_memory_path = DATA_DIR / "integrated_memory.jsonl"
-            moltbook_memory_count = 0
-            if integrated_memory_path.exists():
-                with open(integrated_memory_path, "r", encoding="utf-8") as f:
-                    moltbook_memory_count = sum(1 for _ in f)
-
-            # Get activity log stats
-            activity_path = DATA_DIR / "integrated_activity.jsonl"
-            total_cycles = 0
-            total_comments = 0
-            total_replies = 0
-            total_posts = 0
-            recent_reflections = []
-
-            if activity_path.exists():
-                with open(activity_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            act = json.loads(line)
-                            total_cycles += 1
-                            details = act.get("details", {})
-                            steps = details.get("steps", {})
-
-                            # Count actions
-                            execution = steps.get("execution", {})
-                            for r in execution.get("results", []):
-                                rtype = r.get("type")
-                                if r.get("result", {}).get("success"):
-                                    if rtype == "comment":
-                                        total_comments += 1
-                                    elif rtype == "reply":
-                                        total_replies += 1
-                                    elif rtype == "post":
-                                        total_posts += 1
-
-                            # Collect reflections
-                            reflection = steps.get("reflection", {})
-                            if reflection.get("insight"):
-                                recent_reflections.append({
-                                    "timestamp": act.get("timestamp", "")[:16],
-                                    "insight": reflection.get("insight", "")
-                                })
-                        except:
-                            pass
-
-            # Get dream insights
-            insights_path = DATA_DIR / "insights.jsonl"
-            dream_insights = []
-            dream_count = 0
-            if insights_path.exists():
-                with open(insights_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            entry = json.loads(line)
-                            dream_count += 1
-                            dream_insights.append(entry)
-                        except:
-                            pass
-
-            # Format recent reflections (last 5)
-            reflections_text = ""
-            for r in recent_reflections[-5:][::-1]:
-                reflections_text += f"**[{r['timestamp']}]**\n{r['insight'][:200]}...\n\n---\n\n"
-            reflections_text = reflections_text or "まだ振り返りがありません"
-
-            # Format dream insights (last 5)
-            insights_text = ""
-            for entry in dream_insights[-5:][::-1]:
-                insight = entry.get("insight", "")
-                timestamp = entry.get("timestamp", "")[:16]
-                if insight:
-                    insights_text += f"**[{timestamp}]**\n{insight[:200]}...\n\n---\n\n"
-            insights_text = insights_text or "まだ夢見気づきがありません"
+            # The three log reads are independent and disk-bound; run them
+            # concurrently on worker threads
+            moltbook_memory_count, activity, insights = await asyncio.gather(
+                asyncio.to_thread(
+                    _count_jsonl_lines,
+                    DATA_DIR / "integrated_memory.jsonl"
+                ),
+                asyncio.to_thread(
+                    _scan_jsonl_increment,
+                    DATA_DIR / "integrated_activity.jsonl",
+                    _new_activity_state, _apply_activity_line
+                ),
+                asyncio.to_thread(
+                    _scan_jsonl_increment,
+                    DATA_DIR / "insights.jsonl",
+                    _new_insights_state, _apply_insight_line
+                ),
+            )
+            total_cycles = activity["cycles"]
+            actions = activity["actions"]
+            total_comments = actions["comment"]
+            total_replies = actions["reply"]
+            total_posts = actions["post"]
+            dream_count = insights["count"]
+
+            # Format recent reflections (last 5, newest first)
+            reflections_text = "".join(
+                f"**[{r['timestamp']}]**\n{r['insight'][:200]}...\n\n---\n\n"
+                for r in reversed(activity["reflections"])
+            ) or "まだ振り返りがありません"
+
+            # Surface malformed log lines instead of swallowing them
+            parse_errors = _total_parse_errors()
+            if parse_errors:
+                reflections_text += f"\n\n⚠️ 解析できなかったログ行: {parse_errors}"
+
+            # Format dream insights (last 5, newest first)
+            insights_text = "".join(
+                f"**[{entry.get('timestamp', '')[:16]}]**\n{insight[:200]}...\n\n---\n\n"
+                for entry in reversed(insights["recent"])
+                if (insight := entry.get("insight", ""))
+            ) or "まだ夢見気づきがありません"
 
             # Dream threshold - combined memory from all sources
             dream_threshold = 10
             try:
-                combined_counts = backend.get_total_memory_count()
-                combined_memory = combined_counts["total"]
+                snapshot = await asyncio.to_thread(get_dashboard_snapshot)
+                combined_memory = snapshot["counts"]["total"]
             except Exception:
                 combined_memory = moltbook_memory_count
             dream_progress = min(100, int(combined_memory / dream_threshold * 100))
 
-            return (
+            result = (
                 combined_memory,
                 dream_threshold,
                 dream_progress,
@@ -319,26 +652,31 @@ def create_app():
                 reflections_text,
                 insights_text
             )
+            # Only successful renders are cached; errors stay fresh
+            _dash_cache["ts"] = time.monotonic()
+            _dash_cache["value"] = result
+            return result
         except Exception as e:
             logger.error(f"Dashboard data error: {e}")
             return (0, 10, 0, 0, 0, 0, 0, 0, f"エラー: {e}", "")
 
     def get_dream_status():
         """Get dreaming status (unified)"""
-        threshold = backend.check_dream_threshold()
-        stats = backend.dreaming.get_stats()
+        snapshot = get_dashboard_snapshot()
+        threshold = snapshot["threshold"]
+        stats = snapshot["dream_stats"]
 
         current = threshold.get("current_count", 0)
         max_threshold = threshold.get("threshold", 10)
         progress = min(100, int(current / max_threshold * 100))
 
         # Get pending user feedbacks
-        feedbacks = backend.get_recent_user_feedback(5)
+        feedbacks = snapshot["feedbacks"]
         feedback_preview = ""
         if feedbacks:
-            feedback_preview = "\n\n**処理待ちのユーザーフィードバック:**\n"
-            for f in feedbacks[:3]:
-                feedback_preview += f"- {f.get('feedback', '')[:50]}...\n"
+            feedback_preview = "\n\n**処理待ちのユーザーフィードバック:**\n" + "".join(
+                f"- {f.get('feedback', '')[:50]}...\n" for f in feedbacks[:3]
+            )
 
         status_text = f"""
 **メモリ数**: {current} / {max_threshold}
@@ -586,16 +924,20 @@ def create_app():
                 integrated_agent_state = gr.State(value=None)
 
                 def create_integrated_agent():
-                    """Create integrated agent instance"""
-                    return IntegratedAgent(
-                        data_dir=DATA_DIR,
-                        llm_host=config.get("lm_studio", {}).get("host", "localhost"),
-                        llm_port=config.get("lm_studio", {}).get("port", 1234),
-                        api_token=config.get("lm_studio", {}).get("api_token", ""),
-                        cycle_interval_minutes=5,
-                        post_interval_minutes=30,
-                        dream_threshold=10
-                    )
+                    """Return the process-wide integrated agent (created once)"""
+                    global _INTEGRATED_AGENT
+                    with _INTEGRATED_AGENT_LOCK:
+                        if _INTEGRATED_AGENT is None:
+                            _INTEGRATED_AGENT = IntegratedAgent(
+                                data_dir=DATA_DIR,
+                                llm_host=config.get("lm_studio", {}).get("host", "localhost"),
+                                llm_port=config.get("lm_studio", {}).get("port", 1234),
+                                api_token=config.get("lm_studio", {}).get("api_token", ""),
+                                cycle_interval_minutes=5,
+                                post_interval_minutes=30,
+                                dream_threshold=10
+                            )
+                        return _INTEGRATED_AGENT
 
                 def start_moltbook_main(int_agent):
                     """Start the main Moltbook agent"""
@@ -638,82 +980,79 @@ def create_app():
                         "**次回投稿**: -"
                     )
 
-                def run_manual_cycle(int_agent):
-                    """Run one cycle manually"""
+                # Reachability probe result, reused for 30s so repeated
+                # manual clicks don't re-pay the network round trip
+                _moltbook_liveness = {"ts": 0.0, "ok": False, "detail": ""}
+
+                def _probe_moltbook(int_agent):
+                    """Check that the Moltbook API answers (cached for 30s)"""
+                    now = time.monotonic()
+                    if now - _moltbook_liveness["ts"] < 30.0:
+                        return _moltbook_liveness["ok"], _moltbook_liveness["detail"]
+
+                    import requests
+                    try:
+                        test_response = requests.get(
+                            "https://www.moltbook.com/api/v1/posts",
+                            headers=int_agent.moltbook._moltbook_headers(),
+                            params={"sort": "hot", "limit": 1},
+                            timeout=3
+                        )
+                        logger.info(f"Moltbook API test: status={test_response.status_code}")
+                        ok = test_response.status_code == 200
+                        detail = "" if ok else f"Moltbook API エラー: {test_response.status_code}"
+                    except requests.exceptions.Timeout:
+                        logger.error("Moltbook API timeout")
+                        ok, detail = False, "Moltbook APIタイムアウト（サーバー応答なし）"
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"Moltbook API error: {e}")
+                        ok, detail = False, f"Moltbook API接続エラー: {str(e)[:80]}"
+
+                    _moltbook_liveness.update(ts=now, ok=ok, detail=detail)
+                    return ok, detail
+
+                # The manual cycle future currently in flight, if any
+                _manual_cycle = {"future": None}
+
+                async def run_manual_cycle(int_agent):
+                    """Dispatch one manual cycle to the background worker"""
                     try:
                         logger.info("=== Manual Cycle Starting ===")
                         if int_agent is None:
                             logger.info("Creating new IntegratedAgent...")
                             int_agent = create_integrated_agent()
 
-                        logger.info("Running cycle... (this may take 30-60 seconds)")
-
-                        # First check if Moltbook API is reachable
-                        import requests
-                        try:
-                            test_response = requests.get(
-                                "https://www.moltbook.com/api/v1/posts",
-                                headers=int_agent.moltbook._moltbook_headers(),
-                                params={"sort": "hot", "limit": 1},
-                                timeout=10
-                            )
-                            logger.info(f"Moltbook API test: status={test_response.status_code}")
-                            if test_response.status_code != 200:
-                                return (
-                                    int_agent,
-                                    f"**ステータス**: ❌ Moltbook API エラー: {test_response.status_code}",
-                                    "**サイクル**: -",
-                                    "**次回投稿**: -"
-                                )
-                        except requests.exceptions.Timeout:
-                            logger.error("Moltbook API timeout")
-                            return (
-                                int_agent,
-                                "**ステータス**: ❌ Moltbook APIタイムアウト（サーバー応答なし）",
-                                "**サイクル**: -",
-                                "**次回投稿**: -"
-                            )
-                        except requests.exceptions.RequestException as e:
-                            logger.error(f"Moltbook API error: {e}")
+                        fut = _manual_cycle["future"]
+                        if fut is not None and not fut.done():
                             return (
                                 int_agent,
-                                f"**ステータス**: ❌ Moltbook API接続エラー: {str(e)[:80]}",
+                                "**ステータス**: ⏳ 実行中...（前回のサイクルがまだ完了していません）",
                                 "**サイクル**: -",
                                 "**次回投稿**: -"
                             )
 
-                        result = int_agent.run_cycle()
-
-                        # Format result summary
-                        cycle = result.get("cycle", 0)
-                        steps = result.get("steps", {})
-
-                        # Check if feed was successful
-                        feed_step = steps.get("feed", {})
-                        if not feed_step.get("success"):
-                            error = feed_step.get("error", "Unknown error")
-                            logger.error(f"Feed collection failed: {error}")
+                        # First check if Moltbook API is reachable (3s cap,
+                        # off the event loop)
+                        ok, detail = await asyncio.to_thread(_probe_moltbook, int_agent)
+                        if not ok:
                             return (
                                 int_agent,
-                                f"**ステータス**: ❌ フィード取得失敗: {error}",
-                                f"**サイクル**: {cycle}",
+                                f"**ステータス**: ❌ {detail}",
+                                "**サイクル**: -",
                                 "**次回投稿**: -"
                             )
 
-                        execution = steps.get("execution", {})
-                        results = execution.get("results", [])
-
-                        comments = sum(1 for r in results if r.get("type") in ["comment", "reply"] and r.get("result", {}).get("success"))
-                        posts = sum(1 for r in results if r.get("type") == "post" and r.get("result", {}).get("success"))
-
-                        status = f"**ステータス**: ✅ サイクル {cycle} 完了（コメント: {comments}, 投稿: {posts}）"
-                        logger.info(f"Cycle complete: {status}")
-
+                        # Dispatch and return immediately; the timer below
+                        # picks up the result (cycles take 30-60 seconds)
+                        logger.info("Dispatching cycle... (this may take 30-60 seconds)")
+                        _manual_cycle["future"] = _MANUAL_CYCLE_EXECUTOR.submit(
+                            int_agent.run_cycle
+                        )
                         return (
                             int_agent,
-                            status,
-                            f"**サイクル**: {cycle}",
-                            f"**次回投稿**: {30 - (cycle * 5) % 30}分後" if int_agent.running else "**次回投稿**: -"
+                            "**ステータス**: ⏳ 実行中...（完了すると自動で更新されます）",
+                            "**サイクル**: -",
+                            "**次回投稿**: -"
                         )
                     except Exception as e:
                         logger.error(f"Manual cycle failed: {e}")
@@ -726,86 +1065,114 @@ def create_app():
                             "**次回投稿**: -"
                         )
 
+                def poll_manual_cycle(int_agent):
+                    """Update the status panes once the dispatched cycle ends"""
+                    fut = _manual_cycle["future"]
+                    if fut is None or not fut.done():
+                        return gr.update(), gr.update(), gr.update()
+
+                    _manual_cycle["future"] = None
+                    try:
+                        result = fut.result()
+                    except Exception as e:
+                        logger.error(f"Manual cycle failed: {e}")
+                        return (
+                            f"**ステータス**: ❌ サイクル失敗: {str(e)[:100]}",
+                            "**サイクル**: -",
+                            "**次回投稿**: -"
+                        )
+
+                    # Format result summary
+                    cycle = result.get("cycle", 0)
+                    steps = result.get("steps", {})
+
+                    # Check if feed was successful
+                    feed_step = steps.get("feed", {})
+                    if not feed_step.get("success"):
+                        error = feed_step.get("error", "Unknown error")
+                        logger.error(f"Feed collection failed: {error}")
+                        return (
+                            f"**ステータス**: ❌ フィード取得失敗: {error}",
+                            f"**サイクル**: {cycle}",
+                            "**次回投稿**: -"
+                        )
+
+                    execution = steps.get("execution", {})
+                    results = execution.get("results", [])
+
+                    comments = sum(1 for r in results if r.get("type") in ["comment", "reply"] and r.get("result", {}).get("success"))
+                    posts = sum(1 for r in results if r.get("type") == "post" and r.get("result", {}).get("success"))
+
+                    status = f"**ステータス**: ✅ サイクル {cycle} 完了（コメント: {comments}, 投稿: {posts}）"
+                    logger.info(f"Cycle complete: {status}")
+
+                    return (
+                        status,
+                        f"**サイクル**: {cycle}",
+                        f"**次回投稿**: {30 - (cycle * 5) % 30}分後" if int_agent and int_agent.running else "**次回投稿**: -"
+                    )
+
                 def get_integrated_activity():
                     """Get integrated agent activity log"""
                     log_path = DATA_DIR / "integrated_activity.jsonl"
-                    if not log_path.exists():
-                        return "*まだアクティビティがありません*"
-
-                    lines = []
+                    # Back-to-back refreshes cost one stat() when the log
+                    # hasn't grown
+                    stat_key, rendered = _rendered_if_unchanged(
+                        "activity", log_path
+                    )
+                    if rendered is not None:
+                        return rendered
                     try:
-                        with open(log_path, "r", encoding="utf-8") as f:
-                            activities = [json.loads(line) for line in f][-15:]
-
-                        for act in reversed(activities):
-                            ts = act.get("timestamp", "")[:19]
-                            cycle = act.get("cycle", 0)
-                            details = act.get("details", {})
-                            steps = details.get("steps", {})
-
-                            # Execution summary
-                            execution = steps.get("execution", {})
-                            results = execution.get("results", [])
-
-                            # Count by type
-                            comments = sum(1 for r in results if r.get("type") == "comment" and r.get("result", {}).get("success"))
-                            replies = sum(1 for r in results if r.get("type") == "reply" and r.get("result", {}).get("success"))
-                            posts = sum(1 for r in results if r.get("type") == "post" and r.get("result", {}).get("success"))
-
-                            action_parts = []
-                            if posts > 0:
-                                action_parts.append(f"📝投稿{posts}")
-                            if comments > 0:
-                                action_parts.append(f"💬コメント{comments}")
-                            if replies > 0:
-                                action_parts.append(f"📩返信{replies}")
-
-                            action_str = ", ".join(action_parts) if action_parts else "分析のみ"
-                            lines.append(f"**[{ts}]** サイクル {cycle}: {action_str}")
-
-                    except:
+                        # Shared incremental scan: the dashboard and the
+                        # comments tab read the same parsed state
+                        state = _scan_jsonl_increment(
+                            log_path,
+                            _new_activity_state, _apply_activity_line
+                        )
+                    except Exception:
                         return "*ログ読み込みエラー*"
 
-                    return "\n\n".join(lines) if lines else "*まだアクティビティがありません*"
+                    if not state["recent"]:
+                        return "*まだアクティビティがありません*"
+
+                    lines = []
+                    for act in reversed(state["recent"]):
+                        action_parts = []
+                        if act["posts"] > 0:
+                            action_parts.append(f"📝投稿{act['posts']}")
+                        if act["comments"] > 0:
+                            action_parts.append(f"💬コメント{act['comments']}")
+                        if act["replies"] > 0:
+                            action_parts.append(f"📩返信{act['replies']}")
+
+                        action_str = ", ".join(action_parts) if action_parts else "分析のみ"
+                        lines.append(f"**[{act['timestamp']}]** サイクル {act['cycle']}: {action_str}")
+
+                    rendered = "\n\n".join(lines)
+                    _store_rendered("activity", stat_key, rendered)
+                    return rendered
 
                 def get_comments_history():
                     """Get history of comments/replies made by the agent"""
                     log_path = DATA_DIR / "integrated_activity.jsonl"
-                    if not log_path.exists():
-                        return "*まだコメント履歴がありません*"
-
-                    comments = []
+                    stat_key, rendered = _rendered_if_unchanged(
+                        "comments", log_path
+                    )
+                    if rendered is not None:
+                        return rendered
                     try:
-                        with open(log_path, "r", encoding="utf-8") as f:
-                            for line in f:
-                                try:
-                                    act = json.loads(line)
-                                    details = act.get("details", {})
-                                    steps = details.get("steps", {})
-                                    execution = steps.get("execution", {})
-                                    results = execution.get("results", [])
-
-                                    for r in results:
-                                        rtype = r.get("type")
-                                        result_data = r.get("result", {})
-                                        if rtype in ["comment", "reply"] and result_data.get("success"):
-                                            comment_data = result_data.get("comment", {})
-                                            comments.append({
-                                                "timestamp": act.get("timestamp", "")[:19],
-                                                "type": rtype,
-                                                "target_post": r.get("target", ""),
-                                                "parent": r.get("parent", ""),
-                                                "content": comment_data.get("content", ""),
-                                                "comment_id": comment_data.get("id", "")[:8]
-                                            })
-                                except:
-                                    pass
+                        # Same shared incremental scan as the activity tab;
+                        # only newly-appended lines are parsed
+                        comments = _scan_jsonl_increment(
+                            log_path,
+                            _new_activity_state, _apply_activity_line
+                        )["comments"]
 
                         if not comments:
                             return "*まだコメント履歴がありません*"
 
                         lines = []
-                        for i, c in enumerate(reversed(comments[-20:]), 1):
+                        for i, c in enumerate(reversed(comments), 1):
                             type_label = "📩 返信" if c["type"] == "reply" else "💬 コメント"
                             lines.append(f"---")
                             lines.append(f"### {i}. {type_label}")
@@ -818,7 +1185,9 @@ def create_app():
                             lines.append(f"> {c['content']}")
                             lines.append("")
 
-                        return "\n".join(lines)
+                        rendered = "\n".join(lines)
+                        _store_rendered("comments", stat_key, rendered)
+                        return rendered
                     except Exception as e:
                         return f"*ログ読み込みエラー: {e}*"
 
@@ -838,6 +1207,13 @@ def create_app():
                     inputs=[integrated_agent_state],
                     outputs=[integrated_agent_state, moltbook_status, moltbook_cycle_info, moltbook_next_post]
                 )
+                # Poll for the dispatched manual cycle finishing
+                manual_cycle_timer = gr.Timer(2)
+                manual_cycle_timer.tick(
+                    poll_manual_cycle,
+                    inputs=[integrated_agent_state],
+                    outputs=[moltbook_status, moltbook_cycle_info, moltbook_next_post]
+                )
                 moltbook_refresh_btn.click(
                     get_integrated_activity,
                     inputs=[],
@@ -908,39 +1284,83 @@ def create_app():
 
 def cleanup_old_ports():
     """Kill any zombie Gradio processes on our ports"""
+    ports_to_check = {7860, 7861, 7862, 7863}
+
+    try:
+        import psutil
+    except ImportError:
+        # Fall back to shelling out (Windows netstat/tasklist/taskkill)
+        _cleanup_old_ports_subprocess(ports_to_check)
+        return
+
+    # One in-process connection snapshot replaces netstat plus a tasklist
+    # spawn per candidate port
+    try:
+        connections = psutil.net_connections(kind="tcp")
+    except Exception:
+        return
+    for c in connections:
+        if (c.status == psutil.CONN_LISTEN and c.laddr
+                and c.laddr.port in ports_to_check and c.pid):
+            try:
+                p = psutil.Process(c.pid)
+                if "python" in p.name().lower():
+                    print(f"Killing zombie Python process on port {c.laddr.port} (PID {c.pid})")
+                    p.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+
+def _cleanup_old_ports_subprocess(ports_to_check):
+    """Zombie cleanup without psutil (Windows command-line tools)"""
     import subprocess
-    ports_to_check = [7860, 7861, 7862, 7863]
 
-    for port in ports_to_check:
+    def check_and_kill(port, pid):
         try:
-            # Find process using the port
-            result = subprocess.run(
-                ['netstat', '-ano'],
+            # Check if it's a Python process
+            check = subprocess.run(
+                ['tasklist', '/FI', f'PID eq {pid}'],
                 capture_output=True,
                 text=True,
                 shell=True
             )
-            for line in result.stdout.split('\n'):
-                if f'127.0.0.1:{port}' in line and 'LISTENING' in line:
+            if 'python' in check.stdout.lower():
+                print(f"Killing zombie Python process on port {port} (PID {pid})")
+                subprocess.run(
+                    ['taskkill', '/F', '/PID', pid],
+                    capture_output=True,
+                    shell=True
+                )
+        except Exception:
+            pass  # Ignore errors during cleanup
+
+    try:
+        # One netstat snapshot covers every candidate port
+        result = subprocess.run(
+            ['netstat', '-ano'],
+            capture_output=True,
+            text=True,
+            shell=True
+        )
+        pairs = []
+        for line in result.stdout.split('\n'):
+            if 'LISTENING' not in line:
+                continue
+            for port in ports_to_check:
+                if f'127.0.0.1:{port}' in line:
                     parts = line.split()
                     if parts:
-                        pid = parts[-1]
-                        # Check if it's a Python process
-                        check = subprocess.run(
-                            ['tasklist', '/FI', f'PID eq {pid}'],
-                            capture_output=True,
-                            text=True,
-                            shell=True
-                        )
-                        if 'python' in check.stdout.lower():
-                            print(f"Killing zombie Python process on port {port} (PID {pid})")
-                            subprocess.run(
-                                ['taskkill', '/F', '/PID', pid],
-                                capture_output=True,
-                                shell=True
-                            )
-        except Exception as e:
-            pass  # Ignore errors during cleanup
+                        pairs.append((port, parts[-1]))
+                    break
+        if not pairs:
+            return
+        # The per-pid tasklist/taskkill probes are independent; fan them
+        # out instead of paying ~150ms each on the startup path
+        with ThreadPoolExecutor(max_workers=len(pairs)) as ex:
+            for port, pid in pairs:
+                ex.submit(check_and_kill, port, pid)
+    except Exception:
+        pass  # Ignore errors during cleanup
 
 
 def main():
@@ -2,7 +2,9 @@
 Default configuration and config management
 """
 
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -147,26 +149,27 @@ create_relations: {"relations": [{"from": "概念A", "to": "概念B", "relationT
 }
 
 
+@functools.cache
 def get_config_path() -> Path:
     """Get user config file path"""
     config_dir = Path(__file__).parent
     return config_dir / "user_config.json"
 
 
-def load_config() -> dict:
-    """Load configuration (user config merged with defaults)"""
+@functools.lru_cache(maxsize=1)
+def _cached_load(path: Path, mtime_ns: int) -> dict:
+    """Parse and merge the user config once per (path, mtime) pair"""
     config = DEFAULT_CONFIG.copy()
 
-    user_config_path = get_config_path()
-    if user_config_path.exists():
+    if mtime_ns:
         try:
-            with open(user_config_path, "r", encoding="utf-8") as f:
+            with open(path, "r", encoding="utf-8") as f:
                 user_config = json.load(f)
 
-            # Deep merge
+            # Deep merge (defaults are one level deep, so | per section)
             for key, value in user_config.items():
-                if isinstance(value, dict) and key in config:
-                    config[key] = {**config[key], **value}
+                if isinstance(value, dict) and isinstance(config.get(key), dict):
+                    config[key] = config[key] | value
                 else:
                     config[key] = value
         except Exception as e:
@@ -175,12 +178,30 @@ def load_config() -> dict:
     return config
 
 
+def load_config() -> dict:
+    """Load configuration (user config merged with defaults)
+
+    The parsed result is cached on the file's mtime, so repeated loads
+    reread the JSON only after the file actually changed.
+    """
+    user_config_path = get_config_path()
+    try:
+        mtime_ns = user_config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _cached_load(user_config_path, mtime_ns)
+
+
 def save_config(config: dict) -> bool:
-    """Save user configuration"""
+    """Save user configuration (atomic: temp file then rename)"""
     try:
         user_config_path = get_config_path()
-        with open(user_config_path, "w", encoding="utf-8") as f:
+        tmp_path = user_config_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
+        # A crash mid-write leaves the old config intact
+        os.replace(tmp_path, user_config_path)
+        _cached_load.cache_clear()
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
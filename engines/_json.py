@@ -0,0 +1,31 @@
+"""
+Shared JSON helpers for the engines
+- orjson when installed (parses/serializes bytes directly), stdlib fallback
+- call sites catch ValueError: both stdlib json.JSONDecodeError and
+  orjson.JSONDecodeError subclass it
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data):
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+
+    def dumps_line(obj) -> bytes:
+        """Serialize one JSONL record, newline included, as bytes"""
+        return orjson.dumps(obj) + b"\n"
+else:
+    def loads(data):
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
+
+    def dumps_line(obj) -> bytes:
+        """Serialize one JSONL record, newline included, as bytes"""
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
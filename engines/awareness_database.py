@@ -10,12 +10,20 @@ import json
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
+import bisect
 import hashlib
 import logging
 
+from ._json import loads as _json_loads, dumps_line as _json_dumps_line
+
 logger = logging.getLogger(__name__)
 
 
+def _record_ts(record: dict) -> str:
+    """Sort key: record timestamp (ISO strings order lexicographically)"""
+    return record.get("timestamp", "")
+
+
 class AwarenessDatabase:
     """Awareness Database"""
 
@@ -36,27 +44,90 @@ class AwarenessDatabase:
         # Statistics file
         self.stats_file = self.data_dir / "stats.json"
 
-        # Hash set for duplicate checking
-        self._content_hashes: set[str] = set()
+        # Hash set for duplicate checking (64-bit int digests: cheaper to
+        # store and compare than hex strings)
+        self._content_hashes: set[int] = set()
+
+        # In-memory record store and filter indices; the JSONL file is
+        # parsed once at startup instead of per query
+        self._records: list[dict] = []
+        self._by_type: dict = {}
+        self._by_category: dict = {}
+
+        # Training data line count, validated against the file stat so the
+        # UI's readiness polling doesn't re-read the whole file
+        self._training_count = 0
+        self._training_stat = None
+
+        # Long-lived append handles: one open/close pair per process
+        # instead of one per record
+        self._awareness_fh = None
+        self._training_fh = None
+
         self._load_hashes()
 
+    def _append_handle(self, attr: str, path: Path):
+        """Get (lazily opening) the long-lived append handle for *path*"""
+        fh = getattr(self, attr)
+        if fh is None or fh.closed:
+            fh = open(path, "ab", buffering=64 * 1024)
+            setattr(self, attr, fh)
+        return fh
+
+    def close(self):
+        """Flush and close the append handles"""
+        for fh in (self._awareness_fh, self._training_fh):
+            if fh is not None and not fh.closed:
+                fh.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _load_hashes(self):
-        """Load hashes from existing data"""
+        """Load hashes and filter indices from existing data"""
         if self.awareness_file.exists():
-            with open(self.awareness_file, "r", encoding="utf-8") as f:
+            with open(self.awareness_file, "rb") as f:
                 for line in f:
                     try:
-                        data = json.loads(line)
+                        data = _json_loads(line)
                         content_hash = self._compute_hash(data)
                         self._content_hashes.add(content_hash)
-                    except json.JSONDecodeError:
+                        self._index_record(data)
+                    except ValueError:
                         continue
 
-    def _compute_hash(self, data: dict) -> str:
-        """Compute hash of data"""
-        # Use description + my_response for duplicate detection
-        content = f"{data.get('description', '')}{data.get('my_response', '')}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def _index_record(self, data: dict):
+        """Add a record to the in-memory store and filter indices.
+
+        Store and buckets are kept ordered by timestamp at insertion, so
+        queries slice from the tail instead of sorting. Records normally
+        arrive in timestamp order, making the insort O(1) at the tail.
+        """
+        bisect.insort(self._records, data, key=_record_ts)
+        bisect.insort(
+            self._by_type.setdefault(data.get("type"), []), data, key=_record_ts
+        )
+        bisect.insort(
+            self._by_category.setdefault(data.get("category"), []),
+            data, key=_record_ts
+        )
+
+    def _compute_hash(self, data: dict) -> int:
+        """Compute dedup hash of data
+
+        blake2b is considerably faster than md5 and the key is never
+        persisted, so the algorithm choice is free; 8 bytes of digest is
+        plenty for a dedup set of this size.
+        """
+        # Use description + my_response for duplicate detection; feed the
+        # fields to the hash separately instead of concatenating them first
+        h = hashlib.blake2b(digest_size=8)
+        h.update(data.get("description", "").encode("utf-8"))
+        h.update(data.get("my_response", "").encode("utf-8"))
+        return int.from_bytes(h.digest(), "little")
 
     def save_awareness(self, awareness: dict) -> bool:
         """
@@ -74,11 +145,13 @@ class AwarenessDatabase:
             logger.info("Skipping duplicate awareness")
             return False
 
-        # Save
-        with open(self.awareness_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(awareness, ensure_ascii=False) + "\n")
+        # Save (flush per record so a crash loses nothing)
+        fh = self._append_handle("_awareness_fh", self.awareness_file)
+        fh.write(_json_dumps_line(awareness))
+        fh.flush()
 
         self._content_hashes.add(content_hash)
+        self._index_record(awareness)
         logger.info(f"Awareness saved: {awareness.get('type', 'unknown')}")
 
         # Update statistics
@@ -96,8 +169,18 @@ class AwarenessDatabase:
         Returns:
             Whether save was successful
         """
-        with open(self.training_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(training_data, ensure_ascii=False) + "\n")
+        fh = self._append_handle("_training_fh", self.training_file)
+        fh.write(_json_dumps_line(training_data))
+        fh.flush()
+
+        # Keep the cached count in step with the append
+        if self._training_stat is not None:
+            self._training_count += 1
+            try:
+                st = self.training_file.stat()
+                self._training_stat = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                self._training_stat = None
 
         logger.info("Training data saved")
         return True
@@ -151,50 +234,57 @@ class AwarenessDatabase:
         return stats.get("total_count", 0)
 
     def count_training_data(self) -> int:
-        """Get training data count"""
-        if not self.training_file.exists():
+        """Get training data count (cached until the file stat changes)"""
+        try:
+            st = self.training_file.stat()
+        except OSError:
+            self._training_stat = None
             return 0
-        with open(self.training_file, "r", encoding="utf-8") as f:
-            return sum(1 for _ in f)
 
-    def get_all_awareness(self, limit: int = 100) -> list[dict]:
-        """Get all awareness"""
-        awareness_list = []
-        if not self.awareness_file.exists():
-            return awareness_list
-
-        with open(self.awareness_file, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    awareness_list.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-
-        # Sort by newest first
-        awareness_list.sort(
-            key=lambda x: x.get("timestamp", ""),
-            reverse=True
-        )
+        stat_key = (st.st_size, st.st_mtime_ns)
+        if self._training_stat == stat_key:
+            return self._training_count
+
+        count = 0
+        if st.st_size:
+            # C-level newline count over large chunks instead of Python
+            # line iteration
+            last_byte = b""
+            with open(self.training_file, "rb", buffering=1 << 20) as f:
+                while chunk := f.read(1 << 20):
+                    count += chunk.count(b"\n")
+                    last_byte = chunk[-1:]
+            if last_byte != b"\n":
+                # Unterminated last line still counts
+                count += 1
+        self._training_count = count
+        self._training_stat = stat_key
+        return count
 
-        return awareness_list[:limit]
+    def get_all_awareness(self, limit: int = 100) -> list[dict]:
+        """Get all awareness (newest first)"""
+        # The store is kept timestamp-ordered, so this is a tail slice
+        return self._records[-limit:][::-1]
 
     def get_by_type(self, awareness_type: str, limit: int = 50) -> list[dict]:
-        """Get awareness by type"""
-        all_awareness = self.get_all_awareness(limit=1000)
-        filtered = [a for a in all_awareness if a.get("type") == awareness_type]
-        return filtered[:limit]
+        """Get awareness by type (newest first)"""
+        bucket = self._by_type.get(awareness_type, [])
+        return bucket[-limit:][::-1]
 
     def get_by_category(self, category: str, limit: int = 50) -> list[dict]:
-        """Get awareness by category"""
-        all_awareness = self.get_all_awareness(limit=1000)
-        filtered = [a for a in all_awareness if a.get("category") == category]
-        return filtered[:limit]
+        """Get awareness by category (newest first)"""
+        bucket = self._by_category.get(category, [])
+        return bucket[-limit:][::-1]
 
     def get_high_quality(self, min_score: int = 4, limit: int = 50) -> list[dict]:
-        """Get high quality awareness"""
-        all_awareness = self.get_all_awareness(limit=1000)
-        filtered = [a for a in all_awareness if a.get("learning_potential", 0) >= min_score]
-        return filtered[:limit]
+        """Get high quality awareness (newest first)"""
+        filtered = []
+        for a in reversed(self._records):
+            if a.get("learning_potential", 0) >= min_score:
+                filtered.append(a)
+                if len(filtered) == limit:
+                    break
+        return filtered
 
     def export_training_data(
         self,
@@ -218,14 +308,14 @@ class AwarenessDatabase:
             logger.warning("Training data file does not exist")
             return output_path
 
-        with open(self.training_file, "r", encoding="utf-8") as f_in:
-            with open(output_path, "w", encoding="utf-8") as f_out:
+        with open(self.training_file, "rb") as f_in:
+            with open(output_path, "wb") as f_out:
                 for line in f_in:
                     try:
-                        data = json.loads(line)
+                        data = _json_loads(line)
                         if data.get("metadata", {}).get("score", 0) >= min_score:
                             f_out.write(line)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
 
         logger.info(f"Training data exported: {output_path}")
@@ -8,10 +8,16 @@ Dreaming Engine V3 - Unified Version
 import json
 import logging
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 import requests
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json works too
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # ========== Dream Prompt ==========
@@ -86,6 +92,7 @@ class DreamingEngine:
         self.archives_file = self.data_dir / "dream_archives.jsonl"
         self.user_feedback_file = self.data_dir / "personality_axis" / "user_feedback.jsonl"
         self.mcp_memory_file = self.data_dir / "mcp_memory.json"
+        self.mcp_memory_log = self.data_dir / "mcp_memory.jsonl"
         self.lora_dataset_file = self.data_dir / "lora_dream_dataset.jsonl"
 
     # ========== LLM API ==========
@@ -264,30 +271,83 @@ class DreamingEngine:
         feedbacks = []
         if not self.user_feedback_file.exists():
             return feedbacks
+        loads = orjson.loads if orjson is not None else json.loads
         try:
-            with open(self.user_feedback_file, "r", encoding="utf-8") as f:
+            with open(self.user_feedback_file, "rb", buffering=1 << 20) as f:
                 for line in f:
                     try:
-                        feedbacks.append(json.loads(line.strip()))
-                    except json.JSONDecodeError:
+                        feedbacks.append(loads(line))
+                    except ValueError:
                         continue
         except Exception as e:
             logger.warning(f"Failed to load user feedback: {e}")
         return feedbacks[-limit:]
 
     def _load_mcp_memory(self) -> list:
-        """Load MCP memory entities"""
-        if not self.mcp_memory_file.exists():
-            return []
-        try:
-            with open(self.mcp_memory_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                entities = data.get("entities", [])
-                logger.info(f"Loaded {len(entities)} MCP entities")
-                return entities
-        except Exception as e:
-            logger.warning(f"Failed to load MCP memory: {e}")
-            return []
+        """Load MCP memory entities (snapshot + uncompacted event log)"""
+        entities = []
+        if self.mcp_memory_file.exists():
+            try:
+                with open(self.mcp_memory_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                    entities = data.get("entities", [])
+                    if isinstance(entities, dict):
+                        # v2 snapshot format keys entities by name
+                        entities = list(entities.values())
+            except Exception as e:
+                logger.warning(f"Failed to load MCP memory: {e}")
+
+        # Replay events the LM Studio client has appended since the last
+        # compaction of mcp_memory.json
+        entity_map = {e.get("name", ""): e for e in entities}
+        if self.mcp_memory_log.exists():
+            loads = orjson.loads if orjson is not None else json.loads
+            try:
+                with open(self.mcp_memory_log, "rb") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            event = loads(line)
+                        except ValueError:
+                            continue
+                        self._apply_mcp_event(event, entity_map)
+            except Exception as e:
+                logger.warning(f"Failed to replay MCP memory log: {e}")
+
+        entities = list(entity_map.values())
+        logger.info(f"Loaded {len(entities)} MCP entities")
+        return entities
+
+    def _apply_mcp_event(self, event: dict, entity_map: dict):
+        """Merge one logged mcp/memory tool call into the entity map"""
+        tool = event.get("tool", "")
+        args = event.get("args", {})
+        if "create_entities" in tool:
+            for entity in args.get("entities", []):
+                name = entity.get("name", "")
+                if not name:
+                    continue
+                if name in entity_map:
+                    old_obs = entity_map[name].get("observations", [])
+                    new_obs = entity.get("observations", [])
+                    entity_map[name]["observations"] = list(dict.fromkeys(chain(old_obs, new_obs)))
+                else:
+                    entity_map[name] = entity
+        elif "add_observations" in tool:
+            for obs in args.get("observations", []):
+                name = obs.get("entityName", "")
+                contents = obs.get("contents", [])
+                if name and name in entity_map:
+                    old_obs = entity_map[name].get("observations", [])
+                    entity_map[name]["observations"] = list(dict.fromkeys(chain(old_obs, contents)))
+                elif name:
+                    entity_map[name] = {
+                        "name": name,
+                        "entityType": "auto",
+                        "observations": contents
+                    }
 
     # ========== Formatters ==========
 
@@ -517,13 +577,14 @@ class DreamingEngine:
         insights = []
         if not self.insights_file.exists():
             return insights
-        with open(self.insights_file, "r", encoding="utf-8") as f:
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.insights_file, "rb", buffering=1 << 20) as f:
             for line in f:
                 line = line.strip()
                 if line:
                     try:
-                        insights.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        insights.append(loads(line))
+                    except ValueError:
                         continue
         return insights
 
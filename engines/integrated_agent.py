@@ -5,8 +5,10 @@ Integrated Agent - Six-Axis + Moltbook + Dreaming
 - Periodic dreaming for meta-learning
 """
 
+import hashlib
 import json
 import logging
+import sqlite3
 import threading
 import time
 from datetime import datetime
@@ -14,6 +16,13 @@ from pathlib import Path
 from typing import Optional
 import requests
 
+try:
+    # Optional: enables the semantic tier of ResponseCache
+    import chromadb
+    from chromadb.config import Settings as ChromaSettings
+except ImportError:
+    chromadb = None
+
 from engines.moltbook_agent import MoltbookAgent
 from engines.personality_axis import PersonalityAxisEngine, PERSONALITY_AXES
 from engines.dreaming_engine import DreamingEngine
@@ -63,6 +72,9 @@ FEED_SIXAXIS_PROMPT = """あなたは六軸人格分析システムです。
 ```
 """
 
+# Bump when FEED_SIXAXIS_PROMPT changes so cached analyses are invalidated
+SIXAXIS_PROMPT_VERSION = "v1"
+
 # Personality-injected contemplation prompt
 PERSONALITY_CONTEMPLATION_PROMPT = """あなたはMoltbookで活動するエージェント「AwakenOS2」です。
 
@@ -146,6 +158,157 @@ PERSONALITY_CONTEMPLATION_PROMPT = """あなたはMoltbookで活動するエー
 """
 
 
+class ResponseCache:
+    """SQLite-backed LLM response cache keyed by input hash.
+
+    The same posts keep reappearing across 5-minute feed polls and would be
+    re-analysed with identical prompts; cache hits skip the LLM call
+    entirely. Entries expire after ttl_days.
+
+    When chromadb is installed a second, semantic tier kicks in: inputs are
+    also embedded into an "llm_cache" collection, and an exact-hash miss
+    falls back to a top-1 similarity lookup (cosine >= semantic_threshold),
+    so paraphrased feeds still reuse the earlier analysis.
+    """
+
+    def __init__(self, db_path: Path, ttl_days: int = 7,
+                 semantic_threshold: float = 0.92):
+        self.db_path = db_path
+        self.ttl = ttl_days * 86400
+        self.semantic_threshold = semantic_threshold
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "input_hash TEXT PRIMARY KEY, "
+            "prompt_version TEXT, "
+            "response BLOB, "
+            "created_at INTEGER, "
+            "expires_at INTEGER)"
+        )
+        # Drop anything already expired so the file doesn't grow unbounded
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (int(time.time()),)
+        )
+        self._conn.commit()
+
+        # Semantic tier (same ChromaDB store the rest of the system uses)
+        self._semantic = None
+        if chromadb is not None:
+            try:
+                client = chromadb.PersistentClient(
+                    path=str(db_path.parent / "chromadb"),
+                    settings=ChromaSettings(anonymized_telemetry=False)
+                )
+                self._semantic = client.get_or_create_collection(
+                    name="llm_cache",
+                    metadata={"hnsw:space": "cosine"}
+                )
+            except Exception as e:
+                logger.warning(f"Semantic cache tier disabled: {e}")
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the inputs that determine the response"""
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def _fetch(self, input_hash: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses "
+                "WHERE input_hash = ? AND expires_at > ?",
+                (input_hash, int(time.time()))
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0].decode("utf-8")
+
+    def get(self, input_hash: str) -> Optional[str]:
+        """Return the cached response text, or None on miss/expiry"""
+        response = self._fetch(input_hash)
+        if response is not None:
+            self.hits += 1
+        return response
+
+    def get_semantic(self, text: str, prompt_version: str,
+                     model: str) -> Optional[str]:
+        """Top-1 similarity lookup over previously cached inputs.
+
+        Returns the cached response when the nearest stored input has
+        cosine similarity >= semantic_threshold for the same prompt
+        version and model; counts a miss otherwise.
+        """
+        if self._semantic is not None:
+            try:
+                hit = self._semantic.query(
+                    query_texts=[text],
+                    n_results=1,
+                    where={"$and": [
+                        {"prompt_version": prompt_version},
+                        {"model": model},
+                    ]}
+                )
+                ids = hit.get("ids", [[]])[0]
+                distances = hit.get("distances", [[]])[0]
+                if ids and distances:
+                    similarity = 1.0 - distances[0]
+                    if similarity >= self.semantic_threshold:
+                        response = self._fetch(ids[0])
+                        if response is not None:
+                            self.semantic_hits += 1
+                            logger.info(
+                                f"Semantic cache hit (similarity={similarity:.3f})"
+                            )
+                            return response
+            except Exception as e:
+                logger.debug(f"Semantic cache lookup failed: {e}")
+        self.misses += 1
+        return None
+
+    def put(self, input_hash: str, prompt_version: str, response: str,
+            text: str = None, model: str = ""):
+        """Store a response under its input hash (and embed the input)"""
+        now = int(time.time())
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (input_hash, prompt_version, response.encode("utf-8"),
+                 now, now + self.ttl)
+            )
+            self._conn.commit()
+        if self._semantic is not None and text is not None:
+            try:
+                self._semantic.upsert(
+                    ids=[input_hash],
+                    documents=[text],
+                    metadatas=[{"prompt_version": prompt_version,
+                                "model": model}]
+                )
+            except Exception as e:
+                logger.debug(f"Semantic cache store failed: {e}")
+
+    def stats(self) -> dict:
+        """Hit-rate counters for this process"""
+        total = self.hits + self.semantic_hits + self.misses
+        return {
+            "exact_hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.semantic_hits) / total if total else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class IntegratedAgent:
     """Six-Axis + Moltbook + Dreaming Integrated Agent"""
 
@@ -205,11 +368,14 @@ class IntegratedAgent:
         # Integrated activity log
         self.activity_log = self.data_dir / "integrated_activity.jsonl"
 
+        # Content-hash keyed cache for repeated LLM analyses
+        self.response_cache = ResponseCache(self.data_dir / "llm_cache.sqlite")
+
         # Background thread control
         self.running = False
         self.thread = None
 
-    def _call_llm(self, prompt: str, temperature: float = 0.7) -> str:
+    def _call_llm(self, prompt: str, temperature: float = 0.7, model: str = None) -> str:
         """Call LLM API"""
         try:
             headers = {"Content-Type": "application/json"}
@@ -220,7 +386,7 @@ class IntegratedAgent:
                 f"http://{self.llm_host}:{self.llm_port}/v1/chat/completions",
                 headers=headers,
                 json={
-                    "model": self.moltbook._get_loaded_model(),
+                    "model": model or self.moltbook._get_loaded_model(),
                     "messages": [{"role": "user", "content": prompt}],
                     "temperature": temperature,
                     "max_tokens": 2048
@@ -413,9 +579,29 @@ class IntegratedAgent:
         return "\n".join(lines)
 
     def _analyze_feed_sixaxis(self, feed_summary: str) -> dict:
-        """Analyze feed with six-axis system"""
-        prompt = FEED_SIXAXIS_PROMPT.format(feed_summary=feed_summary)
-        response = self._call_llm(prompt, temperature=0.3)
+        """Analyze feed with six-axis system (cached by content hash)"""
+        model = self.moltbook._get_loaded_model()
+        cache_key = ResponseCache.make_key(
+            feed_summary, SIXAXIS_PROMPT_VERSION, model
+        )
+
+        response = self.response_cache.get(cache_key)
+        if response is None:
+            # Exact miss: a paraphrased feed may still match semantically
+            response = self.response_cache.get_semantic(
+                feed_summary, SIXAXIS_PROMPT_VERSION, model
+            )
+        if response is not None:
+            logger.info("Six-axis analysis served from cache")
+        else:
+            prompt = FEED_SIXAXIS_PROMPT.format(feed_summary=feed_summary)
+            response = self._call_llm(prompt, temperature=0.3, model=model)
+            if response:
+                self.response_cache.put(
+                    cache_key, SIXAXIS_PROMPT_VERSION, response,
+                    text=feed_summary, model=model
+                )
+
         result = self._parse_json(response)
 
         if result:
@@ -676,7 +862,8 @@ class IntegratedAgent:
             "cycle_interval_minutes": self.cycle_interval // 60,
             "dream_interval_cycles": self.dream_interval,
             "next_dream_in": self.dream_interval - (self.cycle_count % self.dream_interval),
-            "memory_count": self.memory.count()
+            "memory_count": self.memory.count(),
+            "llm_cache": self.response_cache.stats()
         }
 
 
@@ -72,6 +72,65 @@ class MemorySystem:
 
         return memory_id
 
+    def save_batch(
+        self,
+        contents: list[str],
+        categories: Optional[list[str]] = None,
+        importances: Optional[list[int]] = None,
+        user_ids: Optional[list[str]] = None,
+        metadatas: Optional[list[Optional[dict]]] = None
+    ) -> list[str]:
+        """
+        Save multiple memories with a single ChromaDB insert
+
+        Unlike per-item save(), this pays the embedding/transaction
+        overhead once for the whole batch.
+
+        Args:
+            contents: Contents to save
+            categories: Categories (parallel to contents)
+            importances: Importance levels (parallel to contents)
+            user_ids: User IDs (parallel to contents)
+            metadatas: Additional metadata dicts (parallel to contents)
+
+        Returns:
+            IDs of saved memories
+        """
+        if not contents:
+            return []
+
+        n = len(contents)
+        categories = categories or ["general"] * n
+        importances = importances or [5] * n
+        user_ids = user_ids or ["default"] * n
+        metadatas = metadatas or [None] * n
+
+        now = datetime.now()
+        stamp = now.strftime('%Y%m%d_%H%M%S_%f')
+        created_at = now.isoformat()
+
+        ids = []
+        doc_metadatas = []
+        for i in range(n):
+            ids.append(f"{user_ids[i]}_{stamp}_{i}")
+            doc_metadata = {
+                "category": categories[i],
+                "importance": importances[i],
+                "user_id": user_ids[i],
+                "created_at": created_at,
+            }
+            if metadatas[i]:
+                doc_metadata.update(metadatas[i])
+            doc_metadatas.append(doc_metadata)
+
+        self.collection.add(
+            ids=ids,
+            documents=contents,
+            metadatas=doc_metadatas
+        )
+
+        return ids
+
     def search(
         self,
         query: str,
@@ -120,23 +179,98 @@ class MemorySystem:
 
         return memories
 
+    def search_multi(
+        self,
+        queries: list[str],
+        user_id: str = "default",
+        limits: Optional[list[int]] = None,
+        categories: Optional[list[Optional[str]]] = None
+    ) -> list[list[dict]]:
+        """
+        Run several similarity searches in one ChromaDB query
+
+        ChromaDB embeds and searches all query texts in a single call,
+        saving one round-trip per extra query. A query carries only one
+        where filter, so per-query category filtering happens client
+        side (with over-fetch to still fill the requested limits).
+
+        Args:
+            queries: Search queries
+            user_id: User ID (shared by all queries)
+            limits: Result count per query (parallel to queries)
+            categories: Category filter per query, None for all
+
+        Returns:
+            One result list per query, same shape as search()
+        """
+        if not queries:
+            return []
+
+        limits = limits or [5] * len(queries)
+        categories = categories or [None] * len(queries)
+
+        n_results = max(limits)
+        if any(categories):
+            n_results *= 3  # over-fetch for client-side category filter
+
+        results = self.collection.query(
+            query_texts=queries,
+            n_results=n_results,
+            where={"user_id": user_id}
+        )
+
+        all_memories = []
+        for qi in range(len(queries)):
+            memories = []
+            docs = results["documents"][qi] if results["documents"] else []
+            for i, doc in enumerate(docs):
+                metadata = results["metadatas"][qi][i] if results["metadatas"] else {}
+                if categories[qi] and metadata.get("category") != categories[qi]:
+                    continue
+                memories.append({
+                    "id": results["ids"][qi][i],
+                    "content": doc,
+                    "metadata": metadata,
+                    "distance": results["distances"][qi][i] if results["distances"] else None
+                })
+                if len(memories) >= limits[qi]:
+                    break
+            all_memories.append(memories)
+
+        return all_memories
+
     def get_recent(
         self,
         user_id: str = "default",
-        limit: int = 10
+        limit: int = 10,
+        category: Optional[str] = None
     ) -> list[dict]:
         """
         Get recent memories
 
+        Uses collection.get, which skips embedding generation and HNSW
+        traversal entirely (unlike a similarity search with an empty query).
+
         Args:
             user_id: User ID
             limit: Number of results to retrieve
+            category: Category to filter (None for all categories)
 
         Returns:
             List of recent memories
         """
+        if category:
+            where_filter = {
+                "$and": [
+                    {"user_id": user_id},
+                    {"category": category}
+                ]
+            }
+        else:
+            where_filter = {"user_id": user_id}
+
         results = self.collection.get(
-            where={"user_id": user_id},
+            where=where_filter,
             limit=limit
         )
 
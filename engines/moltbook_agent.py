@@ -184,6 +184,12 @@ class MoltbookAgent:
         # Moltbook API key
         self.moltbook_api_key = moltbook_api_key or self._load_moltbook_key()
 
+        # Headers are constant for the life of the agent; build them once
+        self._headers = {
+            "Authorization": f"Bearer {self.moltbook_api_key}",
+            "Content-Type": "application/json"
+        }
+
         # Data directory
         self.data_dir = data_dir or Path("./data")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -220,11 +226,8 @@ class MoltbookAgent:
         return ""
 
     def _moltbook_headers(self) -> dict:
-        """Get headers for Moltbook API"""
-        return {
-            "Authorization": f"Bearer {self.moltbook_api_key}",
-            "Content-Type": "application/json"
-        }
+        """Get headers for Moltbook API (precomputed in __init__)"""
+        return self._headers
 
     # ========== Moltbook API Methods ==========
 
@@ -393,7 +396,8 @@ class MoltbookAgent:
 
         headers = self._moltbook_headers()
         if identity_token:
-            headers["X-Moltbook-Identity"] = identity_token
+            # Copy before tweaking: the shared header dict must stay clean
+            headers = {**headers, "X-Moltbook-Identity": identity_token}
 
         # Retry with exponential backoff
         max_retries = 3
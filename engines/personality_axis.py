@@ -14,6 +14,7 @@ LLMの人格6軸理論に基づく入力分析・応答人格決定・振り返
 各軸は -5 〜 +5 のスコア
 """
 
+import atexit
 import json
 import re
 from datetime import datetime
@@ -22,6 +23,11 @@ from typing import Optional
 import requests
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json works too
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # ========== 人格6軸の定義 ==========
@@ -60,14 +66,12 @@ PERSONALITY_AXES = {
 }
 
 # ========== 入力分析 + 応答人格決定プロンプト ==========
+#
+# 固定部分は system メッセージとして毎ターン byte 単位で同一に送る。
+# LM Studio はリクエスト間で共有プレフィックスの KV キャッシュを再利用
+# するため、可変部分（入力・コンテキスト）は user メッセージ側に置く。
 
-PRE_ANALYSIS_PROMPT = """あなたはユーザーの入力を6軸で分析し、応答人格を決定するシステムです。
-
-【ユーザー入力】
-{user_input}
-
-【会話コンテキスト】
-{context}
+PRE_ANALYSIS_SYSTEM_PROMPT = """あなたはユーザーの入力を6軸で分析し、応答人格を決定するシステムです。
 
 【人格6軸】（各軸 -5 〜 +5）
 1. 分析-俯瞰軸: -5=細部分析, +5=全体俯瞰
@@ -83,42 +87,37 @@ PRE_ANALYSIS_PROMPT = """あなたはユーザーの入力を6軸で分析し、
 
 【出力形式】JSON
 ```json
-{{
-  "input_axes": {{
+{
+  "input_axes": {
     "analysis_overview": 0,
     "individual_collective": 0,
     "empathy_responsibility": 0,
     "cooperation_independence": 0,
     "stability_transformation": 0,
     "divergence_convergence": 0
-  }},
-  "response_axes": {{
+  },
+  "response_axes": {
     "analysis_overview": 0,
     "individual_collective": 0,
     "empathy_responsibility": 0,
     "cooperation_independence": 0,
     "stability_transformation": 0,
     "divergence_convergence": 0
-  }}
-}}
+  }
+}
 ```
 """
 
-# ========== 振り返りプロンプト（シンプル版） ==========
-
-REFLECTION_PROMPT = """あなたは自分の応答を振り返り、気づきを得るシステムです。
-
-【ユーザー入力】
+PRE_ANALYSIS_PROMPT = """【ユーザー入力】
 {user_input}
 
-【あなたの応答】
-{assistant_output}
+【会話コンテキスト】
+{context}
+"""
 
-【入力の6軸分析】
-{input_axes}
+# ========== 振り返りプロンプト（シンプル版） ==========
 
-【応答時に設定した人格軸】
-{response_axes}
+REFLECTION_SYSTEM_PROMPT = """あなたは自分の応答を振り返り、気づきを得るシステムです。
 
 【人格6軸リファレンス】
 - analysis_overview: -5=細部分析, +5=全体俯瞰
@@ -136,12 +135,25 @@ REFLECTION_PROMPT = """あなたは自分の応答を振り返り、気づきを
 
 【出力形式】JSON
 ```json
-{{
+{
   "insight": "自由記述の気づき（日本語で）"
-}}
+}
 ```
 """
 
+REFLECTION_PROMPT = """【ユーザー入力】
+{user_input}
+
+【あなたの応答】
+{assistant_output}
+
+【入力の6軸分析】
+{input_axes}
+
+【応答時に設定した人格軸】
+{response_axes}
+"""
+
 
 class PersonalityAxisEngine:
     """人格6軸分析エンジン（シンプル版）"""
@@ -169,6 +181,10 @@ class PersonalityAxisEngine:
         # 最新の分析結果をキャッシュ
         self.last_analysis = None
 
+        # 追記用ファイルハンドルをセッション中保持（初回書き込み時にopen）
+        self._log_handles: dict[Path, object] = {}
+        atexit.register(self._close_logs)
+
     def _get_loaded_model(self) -> str:
         """Get currently loaded model for API calls"""
         try:
@@ -187,8 +203,9 @@ class PersonalityAxisEngine:
             pass
         return "qwen/qwen3-30b-a3b-2507"
 
-    def _call_llm(self, prompt: str, temperature: float = 0.3) -> str:
-        """Call LLM API"""
+    def _call_llm(self, prompt: str, temperature: float = 0.3,
+                  system: str = None) -> str:
+        """Call LLM API (static instructions go in the system message)"""
         try:
             headers = {"Content-Type": "application/json"}
             if self.api_token:
@@ -196,12 +213,16 @@ class PersonalityAxisEngine:
 
             model = self._get_loaded_model()
 
+            messages = [{"role": "user", "content": prompt}]
+            if system:
+                messages.insert(0, {"role": "system", "content": system})
+
             response = requests.post(
                 self.api_url,
                 headers=headers,
                 json={
                     "model": model,
-                    "messages": [{"role": "user", "content": prompt}],
+                    "messages": messages,
                     "temperature": temperature,
                     "max_tokens": 1024
                 },
@@ -246,11 +267,32 @@ class PersonalityAxisEngine:
         except json.JSONDecodeError:
             return {}
 
+    def _close_logs(self):
+        """Close the held-open log handles (registered with atexit)"""
+        for fp in self._log_handles.values():
+            try:
+                fp.close()
+            except Exception:
+                pass
+        self._log_handles.clear()
+
     def _save_log(self, filepath: Path, data: dict):
-        """Save log"""
+        """Save log
+
+        The append handle stays open for the session, so each record
+        costs a write+flush instead of open/write/close. The flush keeps
+        records visible to the readers (dreaming archives this file).
+        """
         data["timestamp"] = datetime.now().isoformat()
-        with open(filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(data, ensure_ascii=False) + "\n")
+        fp = self._log_handles.get(filepath)
+        if fp is None:
+            fp = open(filepath, "ab", buffering=1 << 16)
+            self._log_handles[filepath] = fp
+        if orjson is not None:
+            fp.write(orjson.dumps(data) + b"\n")
+        else:
+            fp.write(json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n")
+        fp.flush()
 
     # ========== 入力分析 + 応答人格決定 ==========
 
@@ -269,7 +311,7 @@ class PersonalityAxisEngine:
             context=context or "(コンテキストなし)"
         )
 
-        response = self._call_llm(prompt)
+        response = self._call_llm(prompt, system=PRE_ANALYSIS_SYSTEM_PROMPT)
         result = self._parse_json_response(response)
 
         if result:
@@ -308,7 +350,8 @@ class PersonalityAxisEngine:
             response_axes=response_axes_str
         )
 
-        response = self._call_llm(prompt, temperature=0.5)
+        response = self._call_llm(prompt, temperature=0.5,
+                                  system=REFLECTION_SYSTEM_PROMPT)
         result = self._parse_json_response(response)
 
         if result:
@@ -391,11 +434,12 @@ class PersonalityAxisEngine:
     def get_recent_reflections(self, limit: int = 10) -> list[dict]:
         """最近の振り返りを取得"""
         reflections = []
+        loads = orjson.loads if orjson is not None else json.loads
         if self.reflection_log.exists():
-            with open(self.reflection_log, "r", encoding="utf-8") as f:
+            with open(self.reflection_log, "rb", buffering=1 << 20) as f:
                 for line in f:
                     try:
-                        reflections.append(json.loads(line))
+                        reflections.append(loads(line))
                     except:
                         pass
         return reflections[-limit:]
@@ -403,11 +447,12 @@ class PersonalityAxisEngine:
     def get_recent_user_feedback(self, limit: int = 10) -> list[dict]:
         """最近のユーザーフィードバックを取得（夢見モード用）"""
         feedbacks = []
+        loads = orjson.loads if orjson is not None else json.loads
         if self.user_feedback_log.exists():
-            with open(self.user_feedback_log, "r", encoding="utf-8") as f:
+            with open(self.user_feedback_log, "rb", buffering=1 << 20) as f:
                 for line in f:
                     try:
-                        feedbacks.append(json.loads(line))
+                        feedbacks.append(loads(line))
                     except:
                         pass
         return feedbacks[-limit:]